@@ -0,0 +1,41 @@
+"""
+Token economy simulation with bonding curves and affiliate dynamics.
+
+This package simulates multiple tokens priced by bonding curves, traded by a pool
+of affiliates who earn commissions and adapt their rates over time. The most
+commonly used classes and functions are re-exported here.
+
+Run the simulation from the repository root with:
+    python -m src.main
+"""
+
+from .bonding_curves import (
+    linear_bonding_curve,
+    exponential_bonding_curve,
+    sigmoid_bonding_curve,
+    root_bonding_curve,
+    inverse_bonding_curve,
+    constant_product_bonding_curve,
+    bonding_curve_functions,
+)
+from .crypto_token import Token, TokenPool
+from .affiliate import Affiliate, AffiliatePool
+from .config import get_config, get_config_from_args
+from .simulation import run_simulation
+
+__all__ = [
+    "linear_bonding_curve",
+    "exponential_bonding_curve",
+    "sigmoid_bonding_curve",
+    "root_bonding_curve",
+    "inverse_bonding_curve",
+    "constant_product_bonding_curve",
+    "bonding_curve_functions",
+    "Token",
+    "TokenPool",
+    "Affiliate",
+    "AffiliatePool",
+    "get_config",
+    "get_config_from_args",
+    "run_simulation",
+]
@@ -4,13 +4,15 @@ Affiliate management system for token economy simulation.
 This module defines the Affiliate class which represents participants in the affiliate
 marketing system within the token economy. Affiliates can earn commissions on trades,
 manage their token portfolios, and dynamically adjust their commission rates based
-on trading performance.
+on trading performance. The AffiliatePool class stores the numeric state of many
+affiliates as parallel NumPy arrays, with each Affiliate acting as a view onto one slot.
 
 Key Features:
 - Dynamic commission rate adjustment based on investment performance
 - Support for both regular and whale affiliates with different investment capacities
 - Portfolio tracking and earnings history management
 - Automated commission calculation and referral tracking
+- Vectorized commission tracking and adjustment across a whole pool
 """
 
 
@@ -20,18 +22,230 @@ from .constants import (
     INITIAL_COMMISSION_RATE, COMMISSION_RATE_MIN, COMMISSION_RATE_MAX,
     WHALE_INVESTMENT_MIN, WHALE_INVESTMENT_MAX, INVESTMENT_THRESHOLD
 )
+from .random_reservoir import default_reservoir
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+logger = logging.getLogger(__name__)
+
+class AffiliatePool:
+    """
+    Stores the numeric state of a group of affiliates as parallel arrays.
+
+    Each field is one array of shape (num_affiliates,), so operations that touch
+    every affiliate (commission tracking, commission adjustment) run as a handful
+    of NumPy operations instead of one Python method call per affiliate. Wallets
+    are a (num_affiliates, num_tokens) matrix with one column per token, in the order
+    of the simulation's token list. The
+    Affiliate class is a view onto one slot of a pool.
+    """
+    def __init__(self, num_affiliates: int, num_tokens: int=0):
+        """
+        Allocates storage for a pool of affiliates.
+
+        Args:
+            num_affiliates (int): The number of affiliate slots in the pool.
+            num_tokens (int): The number of tokens each wallet can hold, indexed by token ID (default: 0).
+
+        Raises:
+            ValueError: If num_affiliates or num_tokens is negative.
+        """
+        if num_affiliates < 0:
+            raise ValueError("Number of affiliates cannot be negative")
+        if num_tokens < 0:
+            raise ValueError("Number of tokens cannot be negative")
+
+        self.commission_rate: np.ndarray = np.zeros(num_affiliates, dtype=np.float64)
+        self.total_earned: np.ndarray = np.zeros(num_affiliates, dtype=np.float64)
+        self.total_referral_amount: np.ndarray = np.zeros(num_affiliates, dtype=np.float64)
+        self.base_currency_balance: np.ndarray = np.zeros(num_affiliates, dtype=np.float64)
+        self.is_whale: np.ndarray = np.zeros(num_affiliates, dtype=bool)
+        self.whale_capacity: np.ndarray = np.zeros(num_affiliates, dtype=np.float64)
+        self.wallet: np.ndarray = np.zeros((num_affiliates, num_tokens), dtype=np.float64)  # Token holdings, one column per token ID
+        # Ring buffer of the last MOVING_AVERAGE_WINDOW investments per affiliate,
+        # with a running sum so the moving average is O(1) to read.
+        self._ri_buf: np.ndarray = np.zeros((num_affiliates, MOVING_AVERAGE_WINDOW), dtype=np.float64)
+        self._ri_idx: np.ndarray = np.zeros(num_affiliates, dtype=np.int64)
+        self._ri_count: np.ndarray = np.zeros(num_affiliates, dtype=np.int64)
+        self._ri_sum: np.ndarray = np.zeros(num_affiliates, dtype=np.float64)
+        self.affiliates: List[Optional["Affiliate"]] = [None] * num_affiliates  # Affiliate view per slot, filled by Affiliate.__init__
+
+    @classmethod
+    def create(cls, num_affiliates: int, initial_commission_rate: float, num_whales: int=0, num_tokens: int=0) -> "AffiliatePool":
+        """
+        Creates a pool together with its affiliate views.
+
+        Args:
+            num_affiliates (int): The number of affiliates.
+            initial_commission_rate (float): The initial commission rate for every affiliate.
+            num_whales (int): How many of the affiliates, starting from ID 0, are whales (default: 0).
+            num_tokens (int): The number of tokens each wallet can hold (default: 0).
+
+        Returns:
+            AffiliatePool: The populated pool.
+        """
+        pool = cls(num_affiliates, num_tokens)
+        for i in range(num_affiliates):
+            Affiliate(i, initial_commission_rate, i < num_whales, pool=pool)
+        return pool
+
+    def __len__(self) -> int:
+        return len(self.affiliates)
+
+    def __getitem__(self, index: int) -> "Affiliate":
+        return self.affiliates[index]
+
+    def __iter__(self):
+        return iter(self.affiliates)
+
+    def resize_wallets(self, num_tokens: int) -> None:
+        """
+        Widens every wallet to hold at least num_tokens tokens, keeping existing holdings.
+
+        Args:
+            num_tokens (int): The number of tokens each wallet must be able to hold.
+        """
+        missing = num_tokens - self.wallet.shape[1]
+        if missing > 0:
+            self.wallet = np.pad(self.wallet, ((0, 0), (0, missing)))
+
+    def record_investment(self, index: int, amount: float) -> None:
+        """
+        Records an investment in an affiliate's moving-average window.
+
+        Args:
+            index (int): The slot index of the affiliate.
+            amount (float): The invested amount.
+        """
+        i = self._ri_idx[index]
+        self._ri_sum[index] += amount - self._ri_buf[index, i]
+        self._ri_buf[index, i] = amount
+        i = (i + 1) % MOVING_AVERAGE_WINDOW
+        self._ri_idx[index] = i
+        if self._ri_count[index] < MOVING_AVERAGE_WINDOW:
+            self._ri_count[index] += 1
+        if i == 0:  # Resync once per lap so the running sum cannot drift
+            self._ri_sum[index] = self._ri_buf[index].sum()
+
+    def record_investments(self, indices: np.ndarray, amounts: np.ndarray) -> None:
+        """
+        Records one investment for each of several affiliates in a single vectorized update.
+
+        Args:
+            indices (np.ndarray): The slot indices of the affiliates. Must not contain duplicates.
+            amounts (np.ndarray): The invested amount per index.
+        """
+        i = self._ri_idx[indices]
+        self._ri_sum[indices] += amounts - self._ri_buf[indices, i]
+        self._ri_buf[indices, i] = amounts
+        i = (i + 1) % MOVING_AVERAGE_WINDOW
+        self._ri_idx[indices] = i
+        self._ri_count[indices] = np.minimum(self._ri_count[indices] + 1, MOVING_AVERAGE_WINDOW)
+        wrapped = indices[i == 0]
+        if wrapped.size:  # Resync once per lap so the running sums cannot drift
+            self._ri_sum[wrapped] = self._ri_buf[wrapped].sum(axis=1)
+
+    def reset_investments(self, index: int, amounts: List[float]) -> None:
+        """
+        Replaces an affiliate's recent investments with the given amounts.
+
+        Args:
+            index (int): The slot index of the affiliate.
+            amounts (List[float]): The investments, oldest first. Only the last
+                MOVING_AVERAGE_WINDOW values are kept.
+        """
+        self._ri_buf[index] = 0.0
+        self._ri_idx[index] = 0
+        self._ri_count[index] = 0
+        self._ri_sum[index] = 0.0
+        for amount in amounts[-MOVING_AVERAGE_WINDOW:]:
+            self.record_investment(index, amount)
+
+    def recent_investments(self, index: int) -> List[float]:
+        """
+        Returns an affiliate's recent investments, oldest first.
+
+        Args:
+            index (int): The slot index of the affiliate.
+
+        Returns:
+            List[float]: The investments in the moving-average window.
+        """
+        count = self._ri_count[index]
+        start = (self._ri_idx[index] - count) % MOVING_AVERAGE_WINDOW
+        return np.roll(self._ri_buf[index], -start)[:count].tolist()
+
+    def average_investment(self, index: Optional[int]=None) -> Union[np.ndarray, float]:
+        """
+        Returns the moving-average investment (0 if none are recorded).
+
+        Args:
+            index (Optional[int]): The slot of a single affiliate. If omitted, the averages of
+                every affiliate are returned as an array.
+
+        Returns:
+            Union[np.ndarray, float]: The average of the given affiliate, or of every affiliate.
+        """
+        if index is not None:
+            return float(self._ri_sum[index] / max(1, self._ri_count[index]))
+        return self._ri_sum / np.maximum(self._ri_count, 1)
+
+    def calculate_commissions(self, trade_amounts: np.ndarray) -> np.ndarray:
+        """
+        Calculates the commission every affiliate earns on its trade amount.
+
+        Args:
+            trade_amounts (np.ndarray): Trade amount per affiliate, shape (num_affiliates,).
+
+        Returns:
+            np.ndarray: The commission earned per affiliate.
+        """
+        return trade_amounts * self.commission_rate
+
+    def track_referral(self, trade_amounts: np.ndarray) -> None:
+        """
+        Tracks one referral per affiliate and updates earnings.
+
+        Args:
+            trade_amounts (np.ndarray): Trade amount per affiliate, shape (num_affiliates,).
+                Use 0 for affiliates without a trade.
+
+        Raises:
+            ValueError: If any trade amount is negative.
+        """
+        if np.any(trade_amounts < 0):
+            raise ValueError("Trade amount cannot be negative")
+
+        self.total_earned += self.calculate_commissions(trade_amounts)
+        self.total_referral_amount += trade_amounts
+
+    def adjust_commission_dynamically(self, step: int) -> None:
+        """
+        Adjusts the commission rate of every affiliate based on recent investment.
+
+        Args:
+            step (int): The current step in the simulation.
+        """
+        if step % COMMISSION_DYNAMICS_STEP == 0:
+            avg_investment = self.average_investment()
+            old_rates = self.commission_rate.copy() if logger.isEnabledFor(logging.DEBUG) else None
+            self.commission_rate += np.where(avg_investment > INVESTMENT_THRESHOLD, DYNAMIC_ADJUSTMENT_RATE, -DYNAMIC_ADJUSTMENT_RATE)
+            np.clip(self.commission_rate, COMMISSION_RATE_MIN, COMMISSION_RATE_MAX, out=self.commission_rate)
+            logger.info("Adjusted commission rates for %d affiliates", len(self))
+            if old_rates is not None:
+                for i, (old_rate, rate, avg) in enumerate(zip(old_rates.tolist(), self.commission_rate.tolist(), avg_investment.tolist())):
+                    logger.debug("Affiliate slot %d commission rate adjusted from %.4f to %.4f based on avg investment %.2f", i, old_rate, rate, avg)
 
 class Affiliate:
     """
     Represents an affiliate in the system.
+
+    The numeric state lives in an AffiliatePool; an affiliate created on its own
+    gets a private single-slot pool.
     """
-    def __init__(self, affiliate_id: int, initial_commission_rate: float, is_whale: bool=False):
+    __slots__ = ("affiliate_id", "pool", "_index", "earnings_history", "commission_rate_history")
+
+    def __init__(self, affiliate_id: int, initial_commission_rate: float, is_whale: bool=False, pool: Optional[AffiliatePool]=None, num_tokens: int=0):
         """
         Initializes an affiliate.
 
@@ -39,26 +253,109 @@ class Affiliate:
             affiliate_id (int): The ID of the affiliate.
             initial_commission_rate (float): The initial commission rate for the affiliate.
             is_whale (bool): Whether the affiliate is a whale (default: False).
+            pool (Optional[AffiliatePool]): Shared pool to store the affiliate's state in. The
+                affiliate ID is used as the slot index. A private pool is created if omitted.
+            num_tokens (int): The number of tokens the wallet of a private pool can hold. Ignored
+                when a pool is given (default: 0). The simulation steps widen the wallet to the
+                token list as needed.
 
         Raises:
-            ValueError: If affiliate_id is negative or initial_commission_rate is out of bounds.
+            ValueError: If affiliate_id is negative, initial_commission_rate is out of bounds, or
+                the slot of the given pool is already taken.
+            IndexError: If affiliate_id is not a valid slot of the given pool.
         """
         if affiliate_id < 0:
             raise ValueError("Affiliate ID cannot be negative")
         if not (COMMISSION_RATE_MIN <= initial_commission_rate <= COMMISSION_RATE_MAX):
             raise ValueError(f"Initial commission rate must be between {COMMISSION_RATE_MIN} and {COMMISSION_RATE_MAX}")
 
+        if pool is None:
+            pool = AffiliatePool(1, num_tokens)
+            index = 0
+        else:
+            if affiliate_id >= len(pool.commission_rate):
+                raise IndexError(f"Affiliate ID {affiliate_id} is outside the pool")
+            if pool.affiliates[affiliate_id] is not None:
+                raise ValueError(f"Affiliate ID {affiliate_id} is already taken in the pool")
+            index = affiliate_id
+
         self.affiliate_id: int = affiliate_id
-        self.commission_rate: float = initial_commission_rate
-        self.is_whale: bool = is_whale
-        self.base_currency_balance: float = 1000.0
-        self.wallet: Dict[str, float] = {}
-        self.total_referral_amount: float = 0.0
-        self.total_earned: float = 0.0
+        self.pool: AffiliatePool = pool
+        self._index: int = index
         self.earnings_history: List[float] = []
         self.commission_rate_history: List[float] = []
-        self.recent_investment: List[float] = []  # Track recent investment amounts
-        self.whale_investment_capacity: float = np.random.uniform(WHALE_INVESTMENT_MIN, WHALE_INVESTMENT_MAX) if is_whale else 0
+
+        pool.commission_rate[index] = initial_commission_rate
+        pool.is_whale[index] = is_whale
+        pool.base_currency_balance[index] = 1000.0
+        pool.total_referral_amount[index] = 0.0
+        pool.total_earned[index] = 0.0
+        pool.wallet[index] = 0.0
+        pool.reset_investments(index, [])  # Track recent investment amounts
+        pool.whale_capacity[index] = default_reservoir.uniform(WHALE_INVESTMENT_MIN, WHALE_INVESTMENT_MAX) if is_whale else 0
+        pool.affiliates[index] = self
+
+    @property
+    def wallet(self) -> np.ndarray:
+        """The affiliate's token holdings indexed by token ID, as a writable view into the pool."""
+        return self.pool.wallet[self._index]
+
+    @property
+    def commission_rate(self) -> float:
+        return float(self.pool.commission_rate[self._index])
+
+    @commission_rate.setter
+    def commission_rate(self, value: float) -> None:
+        self.pool.commission_rate[self._index] = value
+
+    @property
+    def is_whale(self) -> bool:
+        return bool(self.pool.is_whale[self._index])
+
+    @property
+    def base_currency_balance(self) -> float:
+        return float(self.pool.base_currency_balance[self._index])
+
+    @base_currency_balance.setter
+    def base_currency_balance(self, value: float) -> None:
+        self.pool.base_currency_balance[self._index] = value
+
+    @property
+    def total_referral_amount(self) -> float:
+        return float(self.pool.total_referral_amount[self._index])
+
+    @total_referral_amount.setter
+    def total_referral_amount(self, value: float) -> None:
+        self.pool.total_referral_amount[self._index] = value
+
+    @property
+    def total_earned(self) -> float:
+        return float(self.pool.total_earned[self._index])
+
+    @total_earned.setter
+    def total_earned(self, value: float) -> None:
+        self.pool.total_earned[self._index] = value
+
+    @property
+    def whale_investment_capacity(self) -> float:
+        return float(self.pool.whale_capacity[self._index])
+
+    @property
+    def recent_investment(self) -> List[float]:
+        return self.pool.recent_investments(self._index)
+
+    @recent_investment.setter
+    def recent_investment(self, value: List[float]) -> None:
+        self.pool.reset_investments(self._index, value)
+
+    def record_investment(self, amount: float) -> None:
+        """
+        Records an investment in the affiliate's moving-average window.
+
+        Args:
+            amount (float): The invested amount.
+        """
+        self.pool.record_investment(self._index, amount)
 
     def adjust_commission_dynamically(self, step: int) -> None:
         """
@@ -68,13 +365,15 @@ class Affiliate:
             step (int): The current step in the simulation.
         """
         if step % COMMISSION_DYNAMICS_STEP == 0:
-            avg_investment = np.mean(self.recent_investment) if self.recent_investment else 0
+            avg_investment = self.pool.average_investment(self._index)
+            rate = self.commission_rate
             if avg_investment > INVESTMENT_THRESHOLD:
-                self.commission_rate += DYNAMIC_ADJUSTMENT_RATE
+                rate += DYNAMIC_ADJUSTMENT_RATE
             else:
-                self.commission_rate -= DYNAMIC_ADJUSTMENT_RATE
-            self.commission_rate = max(COMMISSION_RATE_MIN, min(self.commission_rate, COMMISSION_RATE_MAX))
-            logging.info(f"Affiliate {self.affiliate_id} commission rate adjusted to {self.commission_rate:.4f} based on avg investment {avg_investment:.2f}")
+                rate -= DYNAMIC_ADJUSTMENT_RATE
+            rate = COMMISSION_RATE_MIN if rate < COMMISSION_RATE_MIN else (COMMISSION_RATE_MAX if rate > COMMISSION_RATE_MAX else rate)
+            self.commission_rate = rate
+            logger.info("Affiliate %d commission rate adjusted to %.4f based on avg investment %.2f", self.affiliate_id, rate, avg_investment)
 
     def calculate_commission(self, trade_amount: float) -> float:
         """
@@ -104,4 +403,4 @@ class Affiliate:
         commission_earned = self.calculate_commission(trade_amount)
         self.total_earned += commission_earned
         self.total_referral_amount += trade_amount
-        logging.info(f"Affiliate {self.affiliate_id} earned commission: {commission_earned:.2f}")
\ No newline at end of file
+        logger.info("Affiliate %d earned commission: %.2f", self.affiliate_id, commission_earned)
\ No newline at end of file
@@ -11,134 +11,295 @@ Available Bonding Curves:
 - Sigmoid: Price follows an S-curve with upper bound (logistic growth)
 - Root: Price increases with square root of supply (diminishing returns)
 - Inverse: Price decreases as supply increases (deflationary)
+- Constant product: Price follows an x*y=k pool against virtual reserves (k / (y' - s)^2)
 
 Key Features:
-- NumPy-compatible implementations for efficient vectorized calculations
+- Scalar fast path using the math module, NumPy path for vectorized calculations
 - Parameter validation and error handling for robustness
 - Configurable parameters for each curve type
 - Collection of all curves for easy integration with token systems
+- Table of default parameters and randomization ranges for each curve
 """
 
+import math
 import numpy as np
-from typing import Callable, List
-import logging
+from typing import Callable, List, Tuple, Union
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+Supply = Union[float, np.ndarray]
+
+# Dtype rule: scalar supplies (Python or NumPy numbers) are evaluated and returned
+# as Python floats; array supplies passed to the public curve functions are cast to
+# float32 once on entry. The kernels themselves keep whatever dtype they are given,
+# so TokenPool, which calls them directly on its float64 supplies, prices in float64.
+_SCALAR_TYPES = (int, float, np.integer, np.floating)
+
+# --- Array Kernels ---
+# Validation lives in the public curve functions below; the kernels only do the
+# arithmetic, writing every intermediate into a single output buffer so an
+# array evaluation costs one allocation no matter how many operators it has.
+
+def _linear_kernel(supply: np.ndarray, m: float, b: float) -> np.ndarray:
+    out = np.multiply(supply, m, out=np.empty_like(supply))
+    out += b
+    return out
+
+def _exponential_kernel(supply: np.ndarray, a: float, k: float) -> np.ndarray:
+    out = np.multiply(supply, k, out=np.empty_like(supply))
+    np.exp(out, out=out)
+    out *= a
+    return out
+
+def _sigmoid_kernel(supply: np.ndarray, K: float, k: float, S0: float) -> np.ndarray:
+    # Stable logistic: with e = exp(-|z|) the price is K / (1 + e) for z >= 0 and
+    # K * e / (1 + e) for z < 0, so exp never sees a large positive argument.
+    z = np.subtract(supply, S0, out=np.empty_like(supply))
+    z *= k
+    below_midpoint = z < 0
+    e = np.abs(z, out=z)
+    np.negative(e, out=e)
+    np.exp(e, out=e)
+    out = np.add(e, 1)
+    np.divide(K, out, out=out)
+    np.multiply(out, e, out=out, where=below_midpoint)
+    return out
+
+def _root_kernel(supply: np.ndarray, k: float) -> np.ndarray:
+    out = np.sqrt(supply, out=np.empty_like(supply))
+    out *= k
+    return out
+
+def _inverse_kernel(supply: np.ndarray, k: float) -> np.ndarray:
+    out = np.add(supply, 1, out=np.empty_like(supply))
+    np.divide(k, out, out=out)
+    return out
+
+def _constant_product_kernel(supply: np.ndarray, k: float, virtual_y: float) -> np.ndarray:
+    out = np.subtract(virtual_y, supply, out=np.empty_like(supply))
+    np.square(out, out=out)
+    np.divide(k, out, out=out)
+    return out
+
+# --- Array Supply Checks ---
+# Shared by the public curve functions and by callers that use the kernels directly,
+# so an array of supplies is rejected the same way whichever path evaluates it.
+
+def _check_supply(supply: np.ndarray, *params: float) -> None:
+    if np.any(supply < 0):
+        raise ValueError("Supply cannot be negative")
+
+def _check_constant_product_supply(supply: np.ndarray, k: float, virtual_y: float) -> None:
+    _check_supply(supply)
+    if np.any(supply >= virtual_y):
+        raise ValueError("Supply must be below the virtual reserve")
 
 # --- Bonding Curve Functions (Numpy Compatible) ---
 
-def linear_bonding_curve(supply: np.ndarray, m: float=0.001, b: float=1) -> np.ndarray:
+def linear_bonding_curve(supply: Supply, m: float=0.001, b: float=1) -> Supply:
     """
     Calculates the price using a linear bonding curve.
 
     Args:
-        supply (np.ndarray): The current supply.
+        supply (Supply): The current supply, as a scalar or an array.
         m (float): The slope of the line.
         b (float): The y-intercept of the line.
 
     Returns:
-        np.ndarray: The price.
+        Supply: The price, a float for scalar supply and an array otherwise.
 
     Raises:
         ValueError: If supply is negative.
     """
-    if np.any(supply < 0):
-        raise ValueError("Supply cannot be negative")
-    return np.array(m, dtype=np.float32) * np.array(supply, dtype=np.float32) + np.array(b, dtype=np.float32)
+    if isinstance(supply, _SCALAR_TYPES):
+        supply = float(supply)
+        if supply < 0:
+            raise ValueError("Supply cannot be negative")
+        return m * supply + b
+    supply = np.asarray(supply, dtype=np.float32)
+    _check_supply(supply)
+    return _linear_kernel(supply, m, b)
 
-def exponential_bonding_curve(supply: np.ndarray, a: float=1, k: float=0.0005) -> np.ndarray:
+def exponential_bonding_curve(supply: Supply, a: float=1, k: float=0.0005) -> Supply:
     """
     Calculates the price using an exponential bonding curve.
 
     Args:
-        supply (np.ndarray): The current supply.
+        supply (Supply): The current supply, as a scalar or an array.
         a (float): The scaling factor.
         k (float): The exponent coefficient.
 
     Returns:
-        np.ndarray: The price.
+        Supply: The price, a float for scalar supply and an array otherwise.
 
     Raises:
         ValueError: If supply is negative or if k is too large causing overflow.
     """
-    if np.any(supply < 0):
-        raise ValueError("Supply cannot be negative")
     if abs(k) > 0.01:  # Prevent potential overflow
         raise ValueError("k coefficient is too large, may cause overflow")
-    return np.array(a, dtype=np.float32) * np.exp(np.array(k, dtype=np.float32) * np.array(supply, dtype=np.float32))
+    if isinstance(supply, _SCALAR_TYPES):
+        supply = float(supply)
+        if supply < 0:
+            raise ValueError("Supply cannot be negative")
+        try:
+            return a * math.exp(k * supply)
+        except OverflowError:  # Match the array path, where np.exp overflows to inf
+            return math.copysign(math.inf, a)
+    supply = np.asarray(supply, dtype=np.float32)
+    _check_supply(supply)
+    return _exponential_kernel(supply, a, k)
 
-def sigmoid_bonding_curve(supply: np.ndarray, K: float=10, k: float=0.0001, S0: float=5000) -> np.ndarray:
+def sigmoid_bonding_curve(supply: Supply, K: float=10, k: float=0.0001, S0: float=5000) -> Supply:
     """
     Calculates the price using a sigmoid bonding curve.
 
     Args:
-        supply (np.ndarray): The current supply.
+        supply (Supply): The current supply, as a scalar or an array.
         K (float): The maximum price.
         k (float): The steepness of the curve.
         S0 (float): The supply at the midpoint of the curve.
 
     Returns:
-        np.ndarray: The price.
+        Supply: The price, a float for scalar supply and an array otherwise.
 
     Raises:
         ValueError: If supply is negative, K is non-positive, or k is non-positive.
     """
-    if np.any(supply < 0):
-        raise ValueError("Supply cannot be negative")
     if K <= 0:
         raise ValueError("K (maximum price) must be positive")
     if k <= 0:
         raise ValueError("k (steepness) must be positive")
-    return np.array(K, dtype=np.float32) / (
-        1
-        + np.exp(
-            -np.array(k, dtype=np.float32)
-            * (np.array(supply, dtype=np.float32) - np.array(S0, dtype=np.float32))
-        )
-    )
-
-def root_bonding_curve(supply: np.ndarray, k: float=0.1) -> np.ndarray:
+    if isinstance(supply, _SCALAR_TYPES):
+        supply = float(supply)
+        if supply < 0:
+            raise ValueError("Supply cannot be negative")
+        z = k * (supply - S0)
+        if z >= 0:
+            return K / (1 + math.exp(-z))
+        e = math.exp(z)
+        return K * e / (1 + e)
+    supply = np.asarray(supply, dtype=np.float32)
+    _check_supply(supply)
+    return _sigmoid_kernel(supply, K, k, S0)
+
+def root_bonding_curve(supply: Supply, k: float=0.1) -> Supply:
     """
     Calculates the price using a root bonding curve.
 
     Args:
-        supply (np.ndarray): The current supply.
+        supply (Supply): The current supply, as a scalar or an array.
         k (float): The scaling factor.
 
     Returns:
-        np.ndarray: The price.
+        Supply: The price, a float for scalar supply and an array otherwise.
 
     Raises:
         ValueError: If supply is negative.
     """
-    if np.any(supply < 0):
-        raise ValueError("Supply cannot be negative")
-    return np.sqrt(np.array(supply, dtype=np.float32)) * np.array(k, dtype=np.float32)
+    if isinstance(supply, _SCALAR_TYPES):
+        supply = float(supply)
+        if supply < 0:
+            raise ValueError("Supply cannot be negative")
+        return math.sqrt(supply) * k
+    supply = np.asarray(supply, dtype=np.float32)
+    _check_supply(supply)
+    return _root_kernel(supply, k)
 
-def inverse_bonding_curve(supply: np.ndarray, k: float=100000) -> np.ndarray:
+def inverse_bonding_curve(supply: Supply, k: float=100000) -> Supply:
     """
     Calculates the price using an inverse bonding curve.
 
     Args:
-        supply (np.ndarray): The current supply.
+        supply (Supply): The current supply, as a scalar or an array.
         k (float): The scaling factor.
 
     Returns:
-        np.ndarray: The price.
+        Supply: The price, a float for scalar supply and an array otherwise.
 
     Raises:
         ValueError: If supply is negative or k is non-positive.
     """
-    if np.any(supply < 0):
-        raise ValueError("Supply cannot be negative")
     if k <= 0:
         raise ValueError("k (scaling factor) must be positive")
-    return np.array(k, dtype=np.float32) / (np.array(supply, dtype=np.float32) + 1)
+    if isinstance(supply, _SCALAR_TYPES):
+        supply = float(supply)
+        if supply < 0:
+            raise ValueError("Supply cannot be negative")
+        return k / (supply + 1)
+    supply = np.asarray(supply, dtype=np.float32)
+    _check_supply(supply)
+    return _inverse_kernel(supply, k)
+
+def constant_product_bonding_curve(supply: Supply, k: float=9.801e11, virtual_y: float=1e6) -> Supply:
+    """
+    Calculates the price using a constant-product bonding curve.
+
+    The token is priced as if held in an x*y=k pool against virtual reserves of
+    virtual_y tokens, so the marginal price k / (virtual_y - supply)^2 rises without
+    bound as supply approaches virtual_y.
+
+    Args:
+        supply (Supply): The current supply, as a scalar or an array.
+        k (float): The pool invariant.
+        virtual_y (float): The virtual token reserve; supply must stay below it.
 
-bonding_curve_functions: List[Callable[[np.ndarray, float, float], np.ndarray]] = [
+    Returns:
+        Supply: The price, a float for scalar supply and an array otherwise.
+
+    Raises:
+        ValueError: If supply is negative, k is non-positive, or supply is not below virtual_y.
+    """
+    if k <= 0:
+        raise ValueError("k (pool invariant) must be positive")
+    if isinstance(supply, _SCALAR_TYPES):
+        supply = float(supply)
+        if supply < 0:
+            raise ValueError("Supply cannot be negative")
+        if supply >= virtual_y:
+            raise ValueError("Supply must be below the virtual reserve")
+        return k / (virtual_y - supply) ** 2
+    supply = np.asarray(supply, dtype=np.float32)
+    _check_constant_product_supply(supply, k, virtual_y)
+    return _constant_product_kernel(supply, k, virtual_y)
+
+bonding_curve_functions: List[Callable[..., Supply]] = [
     linear_bonding_curve,
     exponential_bonding_curve,
     sigmoid_bonding_curve,
     root_bonding_curve,
     inverse_bonding_curve,
-]
\ No newline at end of file
+    constant_product_bonding_curve,
+]
+
+# Array kernels in the same order as bonding_curve_functions. They skip validation and
+# accept parameters as arrays broadcasting against supply, so tokens that share a curve
+# but not its parameters can be priced in one call.
+bonding_curve_kernels: List[Callable[..., np.ndarray]] = [
+    _linear_kernel,
+    _exponential_kernel,
+    _sigmoid_kernel,
+    _root_kernel,
+    _inverse_kernel,
+    _constant_product_kernel,
+]
+
+# Supply checks in the same order as bonding_curve_kernels, taking the same arguments.
+# Run one on a group of supplies before evaluating its kernel directly.
+bonding_curve_supply_checks: List[Callable[..., None]] = [
+    _check_supply,
+    _check_supply,
+    _check_supply,
+    _check_supply,
+    _check_supply,
+    _check_constant_product_supply,
+]
+
+# Positional parameters of each curve in bonding_curve_functions, as
+# (name, default, low, high). The low/high range is used when a token's curve
+# parameters are randomized.
+bonding_curve_parameters: List[Tuple[Tuple[str, float, float, float], ...]] = [
+    (("m", 0.001, 0.0005, 0.002), ("b", 1.0, 0.5, 1.5)),
+    (("a", 1.0, 0.8, 1.2), ("k", 0.0005, 0.0004, 0.0006)),
+    (("K", 10.0, 8.0, 12.0), ("k", 0.0001, 0.00008, 0.00012), ("S0", 5000.0, 4000.0, 6000.0)),
+    (("k", 0.1, 0.08, 0.12),),
+    (("k", 100000.0, 80000.0, 120000.0),),
+    (("k", 9.801e11, 8e11, 1.2e12), ("virtual_y", 1e6, 9e5, 1.1e6)),
+]
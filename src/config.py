@@ -8,64 +8,98 @@ parameters and makes the simulation easily customizable through command-line opt
 Key Features:
 - Command-line argument parsing with sensible defaults
 - Configuration dictionary generation for easy parameter passing
+- Parser built once and cached across calls
+- Programmatic configuration through get_config without touching argparse
 - Integration with constants module for consistent parameter values
 - Support for both programmatic and CLI-based configuration
 
 Command Line Options:
 - Simulation steps, token count, affiliate count
 - Initial supply, price, and commission rate settings
+- Random seed for reproducible runs
 - Easy extension for additional parameters
 """
 
 import argparse
-import logging
-from constants import NUM_SIMULATION_STEPS, NUM_TOKENS, NUM_AFFILIATES, INITIAL_SUPPLY, INITIAL_PRICE, INITIAL_COMMISSION_RATE, INITIAL_TOKEN_INVESTMENT, bonding_curve_change_intervals, BONDING_CURVE_PARAM_CHANGE_INTERVAL
+import functools
+from .logging_setup import configure_logging
+from .constants import NUM_SIMULATION_STEPS, NUM_TOKENS, NUM_AFFILIATES, INITIAL_SUPPLY, INITIAL_PRICE, INITIAL_COMMISSION_RATE, INITIAL_TOKEN_INVESTMENT, BONDING_CURVE_PARAM_CHANGE_INTERVAL
 from typing import Dict, Any
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Default value of every option, keyed by its command-line name
+_DEFAULTS: Dict[str, Any] = {
+    "num_simulation_steps": NUM_SIMULATION_STEPS,
+    "num_tokens": NUM_TOKENS,
+    "num_affiliates": NUM_AFFILIATES,
+    "initial_supply": INITIAL_SUPPLY,
+    "initial_price": INITIAL_PRICE,
+    "initial_commission_rate": INITIAL_COMMISSION_RATE,
+    "seed": None,
+}
 
-def parse_arguments() -> argparse.Namespace:
-    """Parses command line arguments."""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the command line parser once and reuses it on later calls."""
     parser = argparse.ArgumentParser(description="Simulate a token economy.")
     parser.add_argument(
-        "--num_simulation_steps", type=int, default=100, help="Number of simulation steps."
+        "--num_simulation_steps", type=int, default=_DEFAULTS["num_simulation_steps"], help="Number of simulation steps."
     )
     parser.add_argument(
-        "--num_tokens", type=int, default=5, help="Number of tokens to simulate."
+        "--num_tokens", type=int, default=_DEFAULTS["num_tokens"], help="Number of tokens to simulate."
     )
     parser.add_argument(
-        "--num_affiliates", type=int, default=5, help="Number of affiliates."
+        "--num_affiliates", type=int, default=_DEFAULTS["num_affiliates"], help="Number of affiliates."
     )
     parser.add_argument(
-        "--initial_supply", type=int, default=10000, help="Initial token supply."
+        "--initial_supply", type=int, default=_DEFAULTS["initial_supply"], help="Initial token supply."
     )
     parser.add_argument(
-        "--initial_price", type=float, default=1.0, help="Initial token price."
+        "--initial_price", type=float, default=_DEFAULTS["initial_price"], help="Initial token price."
     )
     parser.add_argument(
         "--initial_commission_rate",
         type=float,
-        default=0.10,
+        default=_DEFAULTS["initial_commission_rate"],
         help="Initial affiliate commission rate.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--seed", type=int, default=_DEFAULTS["seed"], help="Random seed for reproducible runs."
+    )
+    return parser
+
+def parse_arguments() -> argparse.Namespace:
+    """Parses command line arguments."""
+    return _build_parser().parse_args()
+
+def _to_config(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts options keyed by command-line name into a configuration dictionary."""
+    return {name.upper(): value for name, value in options.items()}
 
 def get_config_from_args() -> Dict[str, Any]:
     """Gets configuration from command line arguments."""
     args = parse_arguments()
-    return {
-        "NUM_SIMULATION_STEPS": args.num_simulation_steps,
-        "NUM_TOKENS": args.num_tokens,
-        "NUM_AFFILIATES": args.num_affiliates,
-        "INITIAL_SUPPLY": args.initial_supply,
-        "INITIAL_PRICE": args.initial_price,
-        "INITIAL_COMMISSION_RATE": args.initial_commission_rate,
-    }
+    return _to_config({**_DEFAULTS, **vars(args)})
+
+def get_config(**overrides: Any) -> Dict[str, Any]:
+    """
+    Gets configuration from the defaults without parsing the command line.
+
+    Args:
+        **overrides: Options to change, using the command-line names (e.g. num_tokens=8).
+
+    Returns:
+        Dict[str, Any]: The configuration dictionary, in the same format as get_config_from_args.
+
+    Raises:
+        ValueError: If an override is not a known option.
+    """
+    unknown = set(overrides) - set(_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown configuration options: {', '.join(sorted(unknown))}")
+    return _to_config({**_DEFAULTS, **overrides})
 
 if __name__ == "__main__":
+    configure_logging()
     config: Dict[str, Any] = get_config_from_args()
     NUM_SIMULATION_STEPS: int = config["NUM_SIMULATION_STEPS"]
     NUM_TOKENS: int = config["NUM_TOKENS"]
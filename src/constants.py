@@ -56,25 +56,23 @@ BONDING_CURVE_PARAM_CHANGE_INTERVAL: int = 20 # Reduced interval for more freque
 BONDING_CURVE_CHANGE_MIN_STEP: int = 500
 BONDING_CURVE_CHANGE_MAX_STEP: int = 1000
 
-# Variable bonding curve change intervals for each token
+# Variable bonding curve change intervals for each token, generated per run by the
+# simulation driver so they follow the configured token count and seed
 import numpy as np
+from typing import Optional, Union
 
-def generate_bonding_curve_intervals(num_tokens: int, min_step: int = 500, max_step: int = 1001, seed: int = None) -> np.ndarray:
+def generate_bonding_curve_intervals(num_tokens: int, min_step: int = 500, max_step: int = 1001, seed: Optional[Union[int, np.random.SeedSequence]] = None) -> np.ndarray:
     """
     Generate random bonding curve change intervals for tokens.
 
     Args:
         num_tokens (int): Number of tokens.
         min_step (int): Minimum interval step.
-        max_step (int): Maximum interval step.
-        seed (int): Random seed for reproducibility.
+        max_step (int): Maximum interval step (exclusive).
+        seed (Optional[Union[int, np.random.SeedSequence]]): Random seed for reproducibility.
 
     Returns:
         np.ndarray: Array of change intervals.
     """
-    if seed is not None:
-        np.random.seed(seed)
-    return np.random.choice(range(min_step, max_step), size=num_tokens, replace=True)
-
-# Generate bonding curve change intervals with default parameters
-bonding_curve_change_intervals = generate_bonding_curve_intervals(NUM_TOKENS, BONDING_CURVE_CHANGE_MIN_STEP, BONDING_CURVE_CHANGE_MAX_STEP)
\ No newline at end of file
+    rng = np.random.default_rng(seed)
+    return rng.integers(min_step, max_step, size=num_tokens, dtype=np.int32)
@@ -4,6 +4,8 @@ Cryptocurrency token implementation with dynamic bonding curves.
 This module defines the Token class which represents individual cryptocurrency tokens
 in the token economy simulation. Each token has its own supply, price, and bonding
 curve function that determines how the price changes based on supply/demand dynamics.
+The TokenPool class stores the numeric state of many tokens as parallel NumPy arrays,
+with each Token acting as a view onto one slot.
 
 Key Features:
 - Dynamic bonding curve pricing with multiple curve types
@@ -11,29 +13,198 @@ Key Features:
 - Support for bonding curve switching and parameter adjustment
 - Comprehensive logging of price changes and supply updates
 - Integration with various mathematical bonding curve functions
+- Vectorized supply updates across a whole pool, repricing tokens that share a
+  curve in one array call
 
 Token Mechanics:
 - Price calculation based on current supply and bonding curve
 - Transaction fees deducted on all trades (0.25%)
 - Token burns on all trades (0.02%)
-- Support for multiple bonding curve types (linear, exponential, sigmoid, root, inverse)
+- Support for multiple bonding curve types (linear, exponential, sigmoid, root, inverse, constant product)
 """
 
-import numpy as np
 import logging
-from .bonding_curves import bonding_curve_functions
+import numpy as np
+from .bonding_curves import bonding_curve_functions, bonding_curve_kernels, bonding_curve_parameters, bonding_curve_supply_checks
 from .constants import TRANSACTION_FEE_RATE, BURN_RATE
-from typing import Callable, Dict, Any
+from .random_reservoir import default_reservoir
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Curve functions indexed by Token.curve_id, and the reverse lookup used at construction
+_CURVES: Tuple[Callable[..., float], ...] = tuple(bonding_curve_functions)
+_CURVE_IDS: Dict[Callable[..., float], int] = {func: i for i, func in enumerate(_CURVES)}
+
+# Number of positional parameters of each curve, and the widest parameter list
+_CURVE_PARAM_COUNTS: Tuple[int, ...] = tuple(len(params) for params in bonding_curve_parameters)
+_MAX_CURVE_PARAMS: int = max(_CURVE_PARAM_COUNTS)
+
+# Share of a standalone token's trade left after fee and burn; pools keep one per token
+_NET_FACTOR: float = 1.0 - TRANSACTION_FEE_RATE - BURN_RATE
+
+# Below this many stale tokens on one curve, scalar evaluation beats an array-kernel call
+_BATCH_MIN_TOKENS: int = 32
+
+def _bind_curve(curve_id: int, params: Tuple[float, ...]) -> Callable[[float], float]:
+    """Returns a bonding curve with its parameters bound, so pricing skips the per-call lookups."""
+    curve = _CURVES[curve_id]
+    return lambda supply: curve(supply, *params)
+
+def _default_curve_params(curve_id: int) -> Tuple[float, ...]:
+    """Returns the default parameters of a bonding curve, in positional order."""
+    return tuple(default for _, default, _, _ in bonding_curve_parameters[curve_id])
+
+class TokenPool:
+    """
+    Stores the numeric state of a group of tokens as parallel arrays.
+
+    Each field is one array of shape (num_tokens,), so supply updates and repricing
+    across all tokens run as a handful of NumPy operations instead of one Python method
+    call per token. Curve parameters are a (num_tokens, max parameters) matrix padded
+    with zeros, so tokens sharing a curve can be priced with a single kernel call. The
+    Token class is a view onto one slot of a pool; change curve ids and parameters through
+    it, so its cached pricer stays in sync.
+    """
+    def __init__(self, num_tokens: int):
+        """
+        Allocates storage for a pool of tokens.
+
+        Args:
+            num_tokens (int): The number of token slots in the pool.
+
+        Raises:
+            ValueError: If num_tokens is negative.
+        """
+        if num_tokens < 0:
+            raise ValueError("Number of tokens cannot be negative")
+
+        self.supply: np.ndarray = np.zeros(num_tokens, dtype=np.float64)
+        self.price: np.ndarray = np.zeros(num_tokens, dtype=np.float64)
+        self.price_dirty: np.ndarray = np.zeros(num_tokens, dtype=bool)  # Set when supply changes; repriced on the next read
+        self.curve_id: np.ndarray = np.zeros(num_tokens, dtype=np.int64)
+        self.curve_params: np.ndarray = np.zeros((num_tokens, _MAX_CURVE_PARAMS), dtype=np.float64)
+        self.transaction_fee_rate: np.ndarray = np.full(num_tokens, TRANSACTION_FEE_RATE, dtype=np.float64)
+        self.burn_rate: np.ndarray = np.full(num_tokens, BURN_RATE, dtype=np.float64)
+        self.net_factor: np.ndarray = 1.0 - self.transaction_fee_rate - self.burn_rate  # Share of a trade left after fee and burn
+        self.tokens: List[Optional["Token"]] = [None] * num_tokens  # Token view per slot, filled by Token.__init__
+        self._unfilled: int = num_tokens  # Slots still waiting for their Token view
+
+    @classmethod
+    def create(cls, names: List[str], initial_supply: float, initial_price: float, bonding_curve_funcs: List[Callable[..., float]]) -> "TokenPool":
+        """
+        Creates a pool together with its token views.
+
+        Args:
+            names (List[str]): The name of each token; token IDs follow this order.
+            initial_supply (float): The initial supply of every token.
+            initial_price (float): The initial price of every token.
+            bonding_curve_funcs (List[Callable[..., float]]): The initial bonding curve of each token.
+
+        Returns:
+            TokenPool: The populated pool.
+        """
+        pool = cls(len(names))
+        for i, (name, func) in enumerate(zip(names, bonding_curve_funcs)):
+            Token(name, initial_supply, initial_price, func, token_id=i, pool=pool)
+        return pool
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __getitem__(self, index: int) -> "Token":
+        return self.tokens[index]
+
+    def __iter__(self):
+        self._check_filled()
+        return iter(self.tokens)
+
+    def _check_filled(self) -> None:
+        """Raises ValueError while some slots have no Token view, since pool-wide updates need every view."""
+        if self._unfilled:
+            raise ValueError(f"{self._unfilled} of {len(self.tokens)} token slots have no Token yet; create one per slot first")
+
+    def _reprice(self, indices: np.ndarray) -> None:
+        """Recomputes the price of the given tokens one curve at a time."""
+        curve_ids = self.curve_id[indices]
+        for curve_id in np.unique(curve_ids):
+            group = indices[curve_ids == curve_id]
+            if group.size < _BATCH_MIN_TOKENS:
+                for i in group:
+                    self.price[i] = self.tokens[i].calculate_price()
+            else:
+                count = _CURVE_PARAM_COUNTS[curve_id]
+                supply, params = self.supply[group], self.curve_params[group, :count].T
+                bonding_curve_supply_checks[curve_id](supply, *params)  # The kernels skip validation
+                self.price[group] = bonding_curve_kernels[curve_id](supply, *params)
+        self.price_dirty[indices] = False
+
+    def current_prices(self) -> np.ndarray:
+        """
+        Returns the price of every token, repricing stale tokens first.
+
+        Returns:
+            np.ndarray: The price array of the pool. It is updated in place by later trades.
+
+        Raises:
+            ValueError: If a slot has no Token yet, or a stale token's supply is outside the
+                domain of its bonding curve.
+        """
+        self._check_filled()
+        stale = np.flatnonzero(self.price_dirty)
+        if stale.size:
+            self._reprice(stale)
+        return self.price
+
+    def apply_supply_deltas(self, deltas: np.ndarray) -> None:
+        """
+        Applies a net traded amount to each token, as the equivalent buy or sell would.
+
+        Positive deltas are buys and negative deltas are sells; fees and burns are taken
+        from both. The changed tokens are repriced on the next price read.
+
+        Args:
+            deltas (np.ndarray): The net amount traded per token, in token ID order.
+
+        Raises:
+            ValueError: If a slot has no Token yet, or a net sell exceeds the token's supply.
+        """
+        self._check_filled()
+        oversold = np.flatnonzero(-deltas > self.supply)
+        if oversold.size:
+            i = oversold[0]
+            raise ValueError(f"Sell amount ({-deltas[i]}) cannot exceed current supply ({self.supply[i]})")
+
+        changed = np.flatnonzero(deltas)
+        if changed.size == 0:
+            return
+        old_prices = self.current_prices()[changed] if logger.isEnabledFor(logging.INFO) else None
+        self.supply[changed] += deltas[changed] * self.net_factor[changed]
+        self.price_dirty[changed] = True
+
+        if old_prices is not None:
+            self._reprice(changed)
+            for old_price, i in zip(old_prices, changed):
+                logger.info(
+                    "Token %s price updated from %.2f to %.2f. Supply changed to %.2f",
+                    self.tokens[i].name, old_price, self.price[i], self.supply[i],
+                )
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
 
 class Token:
     """
     Represents a cryptocurrency token with a bonding curve.
+
+    A token in a TokenPool is a view onto its slot of the pool arrays. A token created on
+    its own keeps its state in plain attributes instead, so scalar buys, sells and price
+    reads cost no NumPy indexing; a pool only pays off for vectorized updates.
     """
-    def __init__(self, name: str, initial_supply: float, initial_price: float, bonding_curve_func: Callable[[np.ndarray], np.ndarray]):
+    __slots__ = (
+        "name", "token_id", "pool", "_index", "curve_metadata", "_pricer",
+        "_supply", "_price", "_price_dirty", "_curve_id", "_curve_params",  # Used when pool is None
+    )
+
+    def __init__(self, name: str, initial_supply: float, initial_price: float, bonding_curve_func: Callable[[float], float], token_id: int=0, pool: Optional[TokenPool]=None):
         """
         Initializes a token.
 
@@ -41,27 +212,189 @@ class Token:
             name (str): The name of the token.
             initial_supply (float): The initial supply of the token.
             initial_price (float): The initial price of the token.
-            bonding_curve_func (Callable[[np.ndarray], np.ndarray]): The bonding curve function for the token.
+            bonding_curve_func (Callable[[float], float]): The bonding curve function for the token,
+                one of bonding_curve_functions.
+            token_id (int): The position of the token in the simulation's token list and its
+                slot in the pool (default: 0). Affiliate wallets are indexed by list position.
+            pool (Optional[TokenPool]): Shared pool to store the token's state in. The token ID
+                is used as the slot index. If omitted, the token keeps its own state.
 
         Raises:
-            ValueError: If initial_supply or initial_price are negative.
+            ValueError: If initial_supply or initial_price are negative, the bonding curve
+                function is not one of bonding_curve_functions, or the slot of the given pool
+                is already taken.
+            IndexError: If token_id is not a valid slot of the given pool.
         """
         if initial_supply < 0:
             raise ValueError("Initial supply cannot be negative")
         if initial_price < 0:
             raise ValueError("Initial price cannot be negative")
+        curve_id = _CURVE_IDS.get(bonding_curve_func)
+        if curve_id is None:
+            raise ValueError(f"Unknown bonding curve function: {getattr(bonding_curve_func, '__name__', repr(bonding_curve_func))}")
+
+        if pool is not None:
+            if not 0 <= token_id < len(pool.supply):
+                raise IndexError(f"Token ID {token_id} is outside the pool")
+            if pool.tokens[token_id] is not None:
+                raise ValueError(f"Token ID {token_id} is already taken in the pool")
 
         self.name: str = name
-        self.supply: np.ndarray = np.array(initial_supply, dtype=np.float32)
-        self.price: np.ndarray = np.array(initial_price, dtype=np.float32)
-        self.bonding_curve_func: Callable[[np.ndarray], np.ndarray] = bonding_curve_func
-        self.transaction_fee_rate: float = TRANSACTION_FEE_RATE
-        self.burn_rate: float = BURN_RATE
+        self.token_id: int = token_id
+        self.pool: Optional[TokenPool] = pool
+        self._index: int = token_id
         self.curve_metadata: Dict[str, Any] = {"function_name": bonding_curve_func.__name__}
+        self._pricer: Optional[Callable[[float], float]] = None  # Curve with bound parameters, built on first price
+
+        if pool is None:
+            self._supply: float = float(initial_supply)
+            self._price: float = float(initial_price)
+            self._price_dirty: bool = False
+        else:
+            pool.supply[token_id] = initial_supply
+            pool.price[token_id] = initial_price
+            pool.price_dirty[token_id] = False
+            pool.tokens[token_id] = self
+            pool._unfilled -= 1
+        self.curve_id = curve_id
+        self.curve_params = _default_curve_params(curve_id)
+
+    @property
+    def supply(self) -> float:
+        """The current supply of the token; setting it marks the price stale."""
+        pool = self.pool
+        if pool is None:
+            return self._supply
+        return float(pool.supply[self._index])
+
+    @supply.setter
+    def supply(self, value: float) -> None:
+        pool = self.pool
+        if pool is None:
+            self._supply = float(value)
+            self._price_dirty = True
+        else:
+            pool.supply[self._index] = value
+            pool.price_dirty[self._index] = True
+
+    @property
+    def price(self) -> float:
+        """The current price of the token, recomputed lazily after a supply change."""
+        pool = self.pool
+        if pool is None:
+            if self._price_dirty:
+                self._price = self.calculate_price()
+                self._price_dirty = False
+            return self._price
+        i = self._index
+        if pool.price_dirty[i]:
+            pool.price[i] = self.calculate_price()
+            pool.price_dirty[i] = False
+        return float(pool.price[i])
+
+    @property
+    def curve_id(self) -> int:
+        """The position of the token's bonding curve in bonding_curve_functions."""
+        pool = self.pool
+        if pool is None:
+            return self._curve_id
+        return int(pool.curve_id[self._index])
+
+    @curve_id.setter
+    def curve_id(self, value: int) -> None:
+        pool = self.pool
+        if pool is None:
+            self._curve_id = int(value)
+        else:
+            pool.curve_id[self._index] = value
+        self._pricer = None
+
+    @property
+    def curve_params(self) -> Tuple[float, ...]:
+        """The positional parameters passed to the bonding curve."""
+        pool = self.pool
+        if pool is None:
+            return self._curve_params
+        return tuple(pool.curve_params[self._index, :_CURVE_PARAM_COUNTS[self.curve_id]].tolist())
+
+    @curve_params.setter
+    def curve_params(self, values: Tuple[float, ...]) -> None:
+        pool = self.pool
+        if pool is None:
+            self._curve_params = tuple(float(value) for value in values)
+        else:
+            row = pool.curve_params[self._index]
+            row[:] = 0.0
+            row[:len(values)] = values
+        self._pricer = None
+
+    @property
+    def transaction_fee_rate(self) -> float:
+        if self.pool is None:
+            return TRANSACTION_FEE_RATE
+        return float(self.pool.transaction_fee_rate[self._index])
+
+    @property
+    def burn_rate(self) -> float:
+        if self.pool is None:
+            return BURN_RATE
+        return float(self.pool.burn_rate[self._index])
 
-    def calculate_price(self) -> np.ndarray:
+    @property
+    def _net_factor(self) -> float:
+        if self.pool is None:
+            return _NET_FACTOR
+        return float(self.pool.net_factor[self._index])
+
+    @property
+    def bonding_curve_func(self) -> Callable[..., float]:
+        """The bonding curve function currently used by the token."""
+        return _CURVES[self.curve_id]
+
+    def calculate_price(self) -> float:
         """Calculates the price of the token based on the bonding curve."""
-        return self.bonding_curve_func(self.supply)
+        pricer = self._pricer
+        if pricer is None:  # Bind the curve once per curve or parameter change, not once per price
+            pricer = self._pricer = _bind_curve(self.curve_id, self.curve_params)
+        return pricer(self.supply)
+
+    def trade(self, amount: float) -> float:
+        """
+        Buys or sells the token, depending on the sign of the amount.
+
+        Buys and sells share the same arithmetic: the supply moves by the amount net of
+        fees and burns, and the price is recomputed from the bonding curve on next read.
+
+        Args:
+            amount (float): The amount of the token to trade, positive to buy and negative to sell.
+
+        Returns:
+            float: The new price of the token.
+
+        Raises:
+            ValueError: If amount is zero or a sell exceeds supply.
+        """
+        if amount == 0:
+            raise ValueError("Trade amount must be non-zero")
+        supply = self.supply
+        if -amount > supply:
+            raise ValueError(f"Sell amount ({-amount}) cannot exceed current supply ({supply})")
+
+        net_factor = self._net_factor
+        if net_factor <= 0:
+            logger.warning("Trade amount too small after fees and burn for %s. No tokens traded.", self.name)
+            return self.price
+
+        log = logger.isEnabledFor(logging.INFO)
+        old_price = self.price if log else 0.0  # Only read for the log, as it may cost a curve evaluation
+        self.supply = supply + amount * net_factor
+
+        if log:
+            logger.info(
+                "Token %s price updated from %.2f to %.2f (%+.2f). Supply changed to %.2f",
+                self.name, old_price, self.price, self.price - old_price, self.supply,
+            )
+        return self.price
 
     def buy(self, amount: float) -> float:
         """
@@ -78,24 +411,7 @@ class Token:
         """
         if amount <= 0:
             raise ValueError("Buy amount must be positive")
-
-        fee = amount * self.transaction_fee_rate
-        burn = amount * self.burn_rate
-        amount_after_fee = amount - fee - burn
-
-        if amount_after_fee <= 0:
-            logging.warning(f"Buy amount too small after fees and burn for {self.name}. No tokens purchased.")
-            return float(self.price)
-
-        old_price = float(self.price)
-        self.supply += np.array(amount_after_fee, dtype=np.float32)
-        self.price = self.calculate_price()
-        price_change = float(self.price) - old_price
-
-        logging.info(
-            f"Token {self.name} price updated from {old_price:.2f} to {float(self.price):.2f} (+{price_change:.2f}). Supply increased to {float(self.supply):.2f}"
-        )
-        return float(self.price)
+        return self.trade(amount)
 
     def sell(self, amount: float) -> float:
         """
@@ -112,50 +428,21 @@ class Token:
         """
         if amount <= 0:
             raise ValueError("Sell amount must be positive")
-        if amount > float(self.supply):
-            raise ValueError(f"Sell amount ({amount}) cannot exceed current supply ({float(self.supply)})")
-
-        fee = amount * self.transaction_fee_rate
-        burn = amount * self.burn_rate
-        amount_after_fee = amount - fee - burn
-
-        if amount_after_fee <= 0:
-            logging.warning(f"Sell amount too small after fees and burn for {self.name}. No tokens sold.")
-            return float(self.price)
-
-        old_price = float(self.price)
-        self.supply -= np.array(amount_after_fee, dtype=np.float32)
-        self.price = self.calculate_price()
-        price_change = old_price - float(self.price)
-
-        logging.info(
-            f"Token {self.name} price updated from {old_price:.2f} to {float(self.price):.2f} (-{price_change:.2f}). Supply decreased to {float(self.supply):.2f}"
-        )
-        return float(self.price)
+        return self.trade(-amount)
     
     def change_bonding_curve(self) -> None:
         """Changes the bonding curve function of the token."""
-        current_curve_index = bonding_curve_functions.index(self.bonding_curve_func)
-        next_curve_index = (current_curve_index + 1) % len(bonding_curve_functions)
-        self.bonding_curve_func = bonding_curve_functions[next_curve_index]
+        self.curve_id = (self.curve_id + 1) % len(_CURVES)
+        self.curve_params = _default_curve_params(self.curve_id)
         self.curve_metadata = {"function_name": self.bonding_curve_func.__name__}
-        logging.info(f"Token {self.name} bonding curve changed to {self.bonding_curve_func.__name__}")
+        logger.info("Token %s bonding curve changed to %s", self.name, self.bonding_curve_func.__name__)
 
     def change_bonding_curve_parameters(self) -> None:
         """Changes the parameters of the bonding curve function."""
-        if self.bonding_curve_func.__name__ == "linear_bonding_curve":
-            self.bonding_curve_func = lambda supply: bonding_curve_functions[0](supply, m=np.random.uniform(0.0005, 0.002), b=np.random.uniform(0.5, 1.5))
-            self.curve_metadata = {"function_name": "linear_bonding_curve", "params": {"m": "dynamic", "b": "dynamic"}}
-        elif self.bonding_curve_func.__name__ == "exponential_bonding_curve":
-            self.bonding_curve_func = lambda supply: bonding_curve_functions[1](supply, a=np.random.uniform(0.8, 1.2), k=np.random.uniform(0.0004, 0.0006))
-            self.curve_metadata = {"function_name": "exponential_bonding_curve", "params": {"a": "dynamic", "k": "dynamic"}}
-        elif self.bonding_curve_func.__name__ == "sigmoid_bonding_curve":
-            self.bonding_curve_func = lambda supply: bonding_curve_functions[2](supply, K=np.random.uniform(8, 12), k=np.random.uniform(0.00008, 0.00012), S0=np.random.uniform(4000, 6000))
-            self.curve_metadata = {"function_name": "sigmoid_bonding_curve", "params": {"K": "dynamic", "k": "dynamic", "S0": "dynamic"}}
-        elif self.bonding_curve_func.__name__ == "root_bonding_curve":
-            self.bonding_curve_func = lambda supply: bonding_curve_functions[3](supply, k=np.random.uniform(0.08, 0.12))
-            self.curve_metadata = {"function_name": "root_bonding_curve", "params": {"k": "dynamic"}}
-        elif self.bonding_curve_func.__name__ == "inverse_bonding_curve":
-            self.bonding_curve_func = lambda supply: bonding_curve_functions[4](supply, k=np.random.uniform(80000, 120000))
-            self.curve_metadata = {"function_name": "inverse_bonding_curve", "params": {"k": "dynamic"}}
-        logging.info(f"Token {self.name} bonding curve parameters changed for {self.curve_metadata['function_name']}")
\ No newline at end of file
+        params = bonding_curve_parameters[self.curve_id]
+        self.curve_params = tuple(default_reservoir.uniform(low, high) for _, _, low, high in params)
+        self.curve_metadata = {
+            "function_name": self.bonding_curve_func.__name__,
+            "params": {name: value for (name, _, _, _), value in zip(params, self.curve_params)},
+        }
+        logger.info("Token %s bonding curve parameters changed for %s", self.name, self.curve_metadata["function_name"])
@@ -0,0 +1,27 @@
+"""
+Logging configuration for the token economy simulation.
+
+Library modules in this package only create named loggers with
+logging.getLogger(__name__) and never install handlers themselves. This module
+holds the single place where a handler and format are configured, and is called
+from the command-line entry points so that code importing the package as a
+library keeps full control over its own logging setup.
+
+Key Features:
+- One configure_logging() call for the whole application
+- Consistent timestamped message format
+- Adjustable log level for quieter or more verbose runs
+"""
+
+import logging
+
+LOG_FORMAT: str = "%(asctime)s - %(levelname)s - %(message)s"
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configures the root logger for command-line runs.
+
+    Args:
+        level (int): The logging level to emit (default: logging.INFO).
+    """
+    logging.basicConfig(level=level, format=LOG_FORMAT)
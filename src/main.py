@@ -13,13 +13,23 @@ Key Features:
 """
 
 from .simulation import run_simulation
-from .config import NUM_TOKENS
-import pandas as pd
-from typing import Dict, Any, Tuple
+from .bonding_curves import bonding_curve_functions
+from .config import get_config, get_config_from_args
+from .logging_setup import configure_logging
+from typing import Dict, Any, Optional
 
-if __name__ == "__main__":
-    """Runs the simulation and prints a summary of the results."""
-    token_histories, affiliate_histories = run_simulation()
+def main(config: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Runs the simulation and prints a summary of the results.
+
+    Args:
+        config (Optional[Dict[str, Any]]): Configuration dictionary as returned by
+            get_config_from_args. The defaults from get_config are used if omitted.
+    """
+    if config is None:
+        config = get_config()
+    params = {name.lower(): value for name, value in config.items()}
+    token_histories, affiliate_histories = run_simulation(params)
 
     summary: Dict[str, Dict[str, Any]] = {
         "tokens": {},
@@ -28,17 +38,18 @@ if __name__ == "__main__":
 
     for token_name, histories in token_histories.items():
         summary["tokens"][token_name] = {
-            "final_price": histories["price"][-1] if histories["price"] else 0,
-            "final_supply": histories["supply"][-1] if histories["supply"] else 0,
-            "final_bonding_curve": histories["bonding_curve"][-1] if histories["bonding_curve"] else None
+            "final_price": histories["price"][-1] if len(histories["price"]) else 0,
+            "final_supply": histories["supply"][-1] if len(histories["supply"]) else 0,
+            "final_bonding_curve": bonding_curve_functions[histories["bonding_curve"][-1]].__name__ if len(histories["bonding_curve"]) else None
         }
     
+    token_names = list(token_histories)
     for aff_id, histories in affiliate_histories.items():
         summary["affiliates"][aff_id] = {
-            "final_earned": histories["earned"][-1] if histories["earned"] else 0,
-            "final_commission_rate": histories["commission_rate"][-1] if histories["commission_rate"] else 0,
-            "final_base_currency": histories["base_currency_balance"][-1] if histories["base_currency_balance"] else 0,
-            "final_wallet": histories["wallet"][-1] if histories["wallet"] else {}
+            "final_earned": histories["earned"][-1] if len(histories["earned"]) else 0,
+            "final_commission_rate": histories["commission_rate"][-1] if len(histories["commission_rate"]) else 0,
+            "final_base_currency": histories["base_currency_balance"][-1] if len(histories["base_currency_balance"]) else 0,
+            "final_wallet": dict(zip(token_names, histories["wallet"][-1].tolist())) if len(histories["wallet"]) else {}
         }
 
     print("\n--- Token Summary ---")
@@ -52,4 +63,8 @@ if __name__ == "__main__":
     for aff_id, metrics in summary["affiliates"].items():
         print(f"\nAffiliate: {aff_id}")
         print(f"  Final Base Currency: {metrics['final_base_currency']:.2f}")
-        print(f"  Final Commission Rate: {metrics['final_commission_rate']:.4f}")
\ No newline at end of file
+        print(f"  Final Commission Rate: {metrics['final_commission_rate']:.4f}")
+
+if __name__ == "__main__":
+    configure_logging()
+    main(get_config_from_args())
@@ -0,0 +1,77 @@
+"""
+Batched random number reservoir for scalar draws.
+
+This module provides the RandomReservoir class, which serves individual uniform
+random draws from a block of numbers generated in one call to a NumPy Generator.
+Drawing scalars one at a time through NumPy pays the full call and argument-parsing
+overhead per number; drawing a block up front pays it once per block.
+
+Key Features:
+- Uniform draws over arbitrary [low, high) ranges from a shared block
+- Automatic refill when the block is exhausted
+- Reseeding for reproducible runs
+- Backed by the modern NumPy Generator (PCG64) instead of the legacy global state
+- A module-level default reservoir shared by tokens and affiliates
+"""
+
+import numpy as np
+from typing import List, Optional, Union
+
+class RandomReservoir:
+    """
+    Serves scalar uniform draws from a pre-generated block of random numbers.
+    """
+    def __init__(self, size: int=1024, rng: Optional[np.random.Generator]=None):
+        """
+        Initializes a reservoir.
+
+        Args:
+            size (int): How many numbers to generate per block (default: 1024).
+            rng (Optional[np.random.Generator]): The generator to draw blocks from. A new
+                default generator is created if omitted.
+
+        Raises:
+            ValueError: If size is not positive.
+        """
+        if size <= 0:
+            raise ValueError("Reservoir size must be positive")
+
+        self.size: int = size
+        self.rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
+        self._buf: List[float] = []
+        self._cur: int = 0
+        self._refill()
+
+    def _refill(self) -> None:
+        """Draws a new block of numbers in [0, 1)."""
+        self._buf = self.rng.random(self.size).tolist()  # Python floats index faster than ndarray scalars
+        self._cur = 0
+
+    def seed(self, seed: Optional[Union[int, np.random.SeedSequence]]) -> None:
+        """
+        Replaces the generator with a freshly seeded one and discards the current block.
+
+        Args:
+            seed (Optional[Union[int, np.random.SeedSequence]]): The seed for the new generator.
+        """
+        self.rng = np.random.default_rng(seed)
+        self._refill()
+
+    def uniform(self, low: float, high: float) -> float:
+        """
+        Draws a number uniformly from [low, high).
+
+        Args:
+            low (float): The lower bound.
+            high (float): The upper bound.
+
+        Returns:
+            float: The drawn number.
+        """
+        if self._cur >= self.size:
+            self._refill()
+        u = self._buf[self._cur]
+        self._cur += 1
+        return low + (high - low) * u
+
+default_reservoir: RandomReservoir = RandomReservoir()
@@ -29,91 +29,254 @@ Integration Points:
 import time
 import logging
 import numpy as np
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, Tuple, List, Callable
 
 from .constants import (
     NUM_SIMULATION_STEPS, NUM_TOKENS, NUM_AFFILIATES, INITIAL_SUPPLY, INITIAL_PRICE,
-    INITIAL_COMMISSION_RATE, BONDING_CURVE_PARAM_CHANGE_INTERVAL, bonding_curve_change_intervals,
-    MOVING_AVERAGE_WINDOW, BUY_PROBABILITY, SELL_PROBABILITY, MAX_SELL_PERCENTAGE,
+    INITIAL_COMMISSION_RATE, BONDING_CURVE_PARAM_CHANGE_INTERVAL,
+    BONDING_CURVE_CHANGE_MIN_STEP, BONDING_CURVE_CHANGE_MAX_STEP, generate_bonding_curve_intervals,
+    BUY_PROBABILITY, SELL_PROBABILITY, MAX_SELL_PERCENTAGE,
     INITIAL_TOKEN_INVESTMENT
 )
 from .bonding_curves import bonding_curve_functions
-from .crypto_token import Token
-from .affiliate import Affiliate
+from .crypto_token import Token, TokenPool
+from .affiliate import Affiliate, AffiliatePool
+from .random_reservoir import default_reservoir
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+logger = logging.getLogger(__name__)
+
+def _settle_trades(balance: np.ndarray, held: np.ndarray, price: np.ndarray, invest: np.ndarray, is_buy: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Settles a batch of trades, at most one per affiliate, using plain arrays only.
+
+    A buy goes through if the affiliate can pay for it in full; a sell is capped at the
+    tokens the affiliate holds.
+
+    Args:
+        balance (np.ndarray): Base currency balance of the trading affiliate, per trade.
+        held (np.ndarray): Tokens of the traded token held by the affiliate, per trade.
+        price (np.ndarray): Quoted price of the traded token, per trade. Must be positive.
+        invest (np.ndarray): Base currency amount the trade is sized by, per trade.
+        is_buy (np.ndarray): Whether each trade is a buy.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Per trade, the change in the affiliate's
+            balance, the net tokens bought (negative for sells) and the traded amount in
+            base currency.
+    """
+    tokens_to_trade = invest / price
+    bought = np.where(is_buy & (balance >= invest), tokens_to_trade, 0.0)
+    sold = np.where(is_buy, 0.0, np.minimum(tokens_to_trade, held))
+    cost = bought * price
+    proceeds = sold * price
+    return proceeds - cost, bought - sold, cost + proceeds
+
+def _current_prices(tokens: List[Token]) -> np.ndarray:
+    """Returns the current price of every token as a fresh array."""
+    if isinstance(tokens, TokenPool):
+        return tokens.current_prices().copy()
+    return np.array([token.price for token in tokens])
+
+def _trade_slots(balances: np.ndarray, wallet: np.ndarray, is_whale: np.ndarray, whale_capacity: np.ndarray,
+                 tokens: List[Token], params: Dict[str, Any],
+                 record_investments: Callable[[np.ndarray, np.ndarray], None]) -> np.ndarray:
+    """
+    Processes one step of trades over the affiliates' state arrays with vectorized draws.
+
+    Trades are drawn in slots: slot j holds the j-th trade of every affiliate making more
+    than j trades this step, so each affiliate appears at most once per slot and balances
+    stay exact under plain fancy indexing. All trades are quoted at the token prices from
+    the start of the step, and the net supply changes of all tokens are applied together
+    once every slot has been processed.
+
+    Args:
+        balances (np.ndarray): Base currency balance per affiliate, updated in place.
+        wallet (np.ndarray): (num_affiliates, num_tokens) holdings, updated in place.
+        is_whale (np.ndarray): Whether each affiliate is a whale.
+        whale_capacity (np.ndarray): Investment capacity per affiliate (0 for non-whales).
+        tokens (List[Token]): The tokens in the simulation, either a list or a TokenPool.
+        params (Dict[str, Any]): Dictionary of simulation parameters.
+        record_investments (Callable[[np.ndarray, np.ndarray], None]): Books the
+            investment amounts of the given affiliate indices.
 
-def _process_affiliate_trades(affiliate: Affiliate, tokens: List[Token], step: int, params: Dict[str, Any]) -> Affiliate:
-    """Processes the trades for a single affiliate."""
-    num_transactions = np.random.randint(1, 3) if not affiliate.is_whale else np.random.randint(0, 2)
+    Returns:
+        np.ndarray: The traded amount per affiliate to track as referrals.
+    """
+    rng = params.get('rng')
+    if rng is None:
+        rng = np.random.default_rng()
     initial_token_investment = params.get('initial_token_investment', INITIAL_TOKEN_INVESTMENT)
+    num_tokens = len(tokens)
+
+    prices = _current_prices(tokens)  # Quotes for the whole step
+    referral_amounts = np.zeros(len(balances))
+    supply_delta = np.zeros(num_tokens)
+
+    min_transactions = np.where(is_whale, 0, 1)  # Whales trade 0-1 times, everyone else 1-2 times
+    num_transactions = rng.integers(min_transactions, min_transactions + 2)
+    whale_trader = is_whale & (whale_capacity > 0)
+
+    for slot in range(int(num_transactions.max(initial=0))):
+        traders = np.flatnonzero(num_transactions > slot)
+        token_idx = rng.integers(0, num_tokens, size=traders.size)
+        invest = np.where(
+            whale_trader[traders],
+            whale_capacity[traders] * rng.uniform(0.1, 0.4, size=traders.size),
+            initial_token_investment + rng.random(traders.size) * 5,
+        )
+        is_buy = rng.random(traders.size) < BUY_PROBABILITY
 
-    for _ in range(num_transactions):
-        random_token_index = np.random.randint(len(tokens))
-        token = tokens[random_token_index]
-
-        if affiliate.is_whale and affiliate.whale_investment_capacity > 0:
-            invest_amount = affiliate.whale_investment_capacity * np.random.uniform(0.1, 0.4)
-        else:
-            invest_amount = initial_token_investment + (np.random.rand(1)[0] * 5)
-
-        token_price = token.price
-        if token_price > 0:
-            tokens_to_trade = invest_amount / token_price
-        else:
-            tokens_to_trade = 0
-            continue
-
-        if np.random.rand() < BUY_PROBABILITY:
-            cost = tokens_to_trade * token_price
-            if affiliate.base_currency_balance >= cost:
-                token = _buy_token(token, affiliate, tokens_to_trade, cost)
-                logging.debug(f"Affiliate {affiliate.affiliate_id} bought {tokens_to_trade:.2f} {token.name} for {cost:.2f}")
-            else:
-                logging.debug(f"Affiliate {affiliate.affiliate_id} could not afford to buy {token.name}")
-        else:
-            affiliate = _sell_token(token, affiliate, tokens_to_trade)
-
-        affiliate.recent_investment.append(invest_amount)
-        if len(affiliate.recent_investment) > MOVING_AVERAGE_WINDOW:
-            affiliate.recent_investment.pop(0)
-    return affiliate
-
-def _buy_token(token: Token, affiliate: Affiliate, tokens_to_trade: float, cost: float) -> Token:
-    """Executes a buy order."""
-    token.buy(tokens_to_trade)
-    affiliate.base_currency_balance -= cost
-    if token.name not in affiliate.wallet:
-        affiliate.wallet[token.name] = 0.0
-    affiliate.wallet[token.name] += tokens_to_trade
-    affiliate.track_referral(cost)  # Track commission on buy
-    return token
-
-def _sell_token(token: Token, affiliate: Affiliate, tokens_to_trade: float) -> Affiliate:
-    """Executes a sell order."""
-    tokens_available = affiliate.wallet.get(token.name, 0)
-    tokens_to_sell = min(tokens_to_trade, tokens_available)
-    if tokens_to_sell > 0:
-        token_price = token.sell(tokens_to_sell)
-        sale_proceeds = token_price * tokens_to_sell
-        affiliate.wallet[token.name] -= tokens_to_sell
-        affiliate.base_currency_balance += sale_proceeds
-        logging.debug(f"Affiliate {affiliate.affiliate_id} sold {tokens_to_sell:.2f} {token.name} for {sale_proceeds:.2f}")
-        affiliate.track_referral(sale_proceeds)  # Track commission on sell
-    else:
-        logging.debug(f"Affiliate {affiliate.affiliate_id} has no {token.name} to sell")
-    return affiliate
+        price = prices[token_idx]
+        tradable = price > 0
+        traders, token_idx, invest, is_buy, price = (
+            traders[tradable], token_idx[tradable], invest[tradable], is_buy[tradable], price[tradable]
+        )
+        held = wallet[traders, token_idx]
+        balance_delta, net, turnover = _settle_trades(balances[traders], held, price, invest, is_buy)
+        balances[traders] += balance_delta
+        referral_amounts[traders] += turnover
+        wallet[traders, token_idx] += net  # One trade per affiliate per slot, so the pairs are unique
+        supply_delta += np.bincount(token_idx, weights=net, minlength=num_tokens)
+
+        record_investments(traders, invest)
+
+    _apply_supply_deltas(tokens, supply_delta)
+    return referral_amounts
+
+def _sell_positions(balances: np.ndarray, wallet: np.ndarray, tokens: List[Token], params: Dict[str, Any]) -> np.ndarray:
+    """
+    Processes one step of periodic sells over the affiliates' state arrays with vectorized draws.
+
+    Each held position is sold from with probability SELL_PROBABILITY, by a random fraction
+    of up to MAX_SELL_PERCENTAGE. The sells of every token are applied to its supply at once
+    and all of them are priced at the token's price after the sells, as a lone sell is.
+
+    Args:
+        balances (np.ndarray): Base currency balance per affiliate, updated in place.
+        wallet (np.ndarray): (num_affiliates, num_tokens) holdings, updated in place.
+        tokens (List[Token]): The tokens in the simulation, either a list or a TokenPool.
+        params (Dict[str, Any]): Dictionary of simulation parameters.
+
+    Returns:
+        np.ndarray: The sale proceeds per affiliate to track as referrals.
+    """
+    rng = params.get('rng')
+    if rng is None:
+        rng = np.random.default_rng()
+    selling = (wallet > 0) & (rng.random(wallet.shape) < SELL_PROBABILITY)
+    if not selling.any():
+        return np.zeros(len(balances))
+    sold = np.where(selling, wallet * (rng.random(wallet.shape) * MAX_SELL_PERCENTAGE), 0.0)
+
+    _apply_supply_deltas(tokens, -sold.sum(axis=0))
+    proceeds = sold @ _current_prices(tokens)
+    wallet -= sold
+    balances += proceeds
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Sold %d positions for %.2f (periodic sell)", np.count_nonzero(selling), proceeds.sum())
+    return proceeds
+
+def _gather_affiliates(affiliates: List[Affiliate], num_tokens: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Copies the balances and wallets of a list of affiliates into pool-shaped arrays."""
+    balances = np.array([affiliate.base_currency_balance for affiliate in affiliates], dtype=np.float64)
+    wallet = np.array([affiliate.wallet[:num_tokens] for affiliate in affiliates], dtype=np.float64).reshape(len(affiliates), num_tokens)
+    return balances, wallet
+
+def _scatter_affiliates(affiliates: List[Affiliate], balances: np.ndarray, wallet: np.ndarray) -> None:
+    """Writes arrays filled by _gather_affiliates back to the affiliates."""
+    num_tokens = wallet.shape[1]
+    for affiliate, balance, holdings in zip(affiliates, balances.tolist(), wallet):
+        affiliate.base_currency_balance = balance
+        affiliate.wallet[:num_tokens] = holdings
+
+def _process_trades(affiliates: List[Affiliate], tokens: List[Token], params: Dict[str, Any]) -> np.ndarray:
+    """
+    Processes one step of trades for every affiliate and returns the amounts to track as referrals.
+
+    A pool is traded on its own arrays; a list of affiliates is gathered into the same
+    layout first, so both go through _trade_slots and draw identically from params['rng'].
+    """
+    if isinstance(affiliates, AffiliatePool):
+        return _trade_slots(affiliates.base_currency_balance, affiliates.wallet, affiliates.is_whale,
+                            affiliates.whale_capacity, tokens, params, affiliates.record_investments)
+
+    def record_investments(indices: np.ndarray, amounts: np.ndarray) -> None:
+        for i, amount in zip(indices.tolist(), amounts.tolist()):
+            affiliates[i].record_investment(amount)
+
+    balances, wallet = _gather_affiliates(affiliates, len(tokens))
+    is_whale = np.array([affiliate.is_whale for affiliate in affiliates], dtype=bool)
+    whale_capacity = np.array([affiliate.whale_investment_capacity for affiliate in affiliates], dtype=np.float64)
+    referral_amounts = _trade_slots(balances, wallet, is_whale, whale_capacity, tokens, params, record_investments)
+    _scatter_affiliates(affiliates, balances, wallet)
+    return referral_amounts
+
+def _process_sells(affiliates: List[Affiliate], tokens: List[Token], params: Dict[str, Any]) -> np.ndarray:
+    """Processes one step of periodic sells for every affiliate and returns the proceeds to track as referrals."""
+    if isinstance(affiliates, AffiliatePool):
+        return _sell_positions(affiliates.base_currency_balance, affiliates.wallet, tokens, params)
+    balances, wallet = _gather_affiliates(affiliates, len(tokens))
+    proceeds = _sell_positions(balances, wallet, tokens, params)
+    _scatter_affiliates(affiliates, balances, wallet)
+    return proceeds
+
+def _apply_supply_deltas(tokens: List[Token], deltas: np.ndarray) -> None:
+    """Applies the net traded amount per token, in one vectorized update for a pool."""
+    if isinstance(tokens, TokenPool):
+        tokens.apply_supply_deltas(deltas)
+        return
+    for i in np.flatnonzero(deltas):
+        tokens[i].trade(float(deltas[i]))
+
+def _ensure_wallets(affiliates: List[Affiliate], num_tokens: int) -> None:
+    """Widens any wallet with fewer columns than there are tokens; columns follow token list order."""
+    if isinstance(affiliates, AffiliatePool):
+        affiliates.resize_wallets(num_tokens)
+        return
+    for affiliate in affiliates:
+        if len(affiliate.wallet) < num_tokens:
+            affiliate.pool.resize_wallets(num_tokens)
+
+def _track_referrals(affiliates: List[Affiliate], referral_amounts: np.ndarray) -> None:
+    """Books each affiliate's referral amount for the step, in one vectorized call for a pool."""
+    if isinstance(affiliates, AffiliatePool):
+        affiliates.track_referral(referral_amounts)
+        return
+    for affiliate, amount in zip(affiliates, referral_amounts):
+        if amount > 0:
+            affiliate.track_referral(amount)
+
+def _build_change_schedule(num_steps: int, intervals: List[int]) -> np.ndarray:
+    """Returns a (num_steps, num_tokens) mask that is True where a token changes its bonding curve."""
+    schedule = np.zeros((num_steps, len(intervals)), dtype=bool)
+    for i, interval in enumerate(intervals):
+        schedule[::interval, i] = True
+    return schedule
 
 def _update_tokens(tokens: List[Token], step: int, params: Dict[str, Any]) -> List[Token]:
-    """Updates the bonding curve of each token."""
+    """
+    Updates the bonding curve of each token.
+
+    Without a change schedule or 'bonding_curve_change_intervals' in params, a random
+    interval per token is drawn on the first call (seeded from params['seed'] if given)
+    and stored in params, so later steps keep using the same intervals.
+    """
     bonding_curve_param_change_interval = params.get('bonding_curve_param_change_interval', 20)
-    for i, token in enumerate(tokens):
-        if step % bonding_curve_change_intervals[i] == 0:
-            token.change_bonding_curve()
+    schedule = params.get('bonding_curve_change_schedule')
+    if schedule is not None and step < len(schedule):
+        changing = np.flatnonzero(schedule[step])
+    else:
+        bonding_curve_change_intervals = params.get('bonding_curve_change_intervals')
+        if bonding_curve_change_intervals is None:
+            bonding_curve_change_intervals = params['bonding_curve_change_intervals'] = generate_bonding_curve_intervals(
+                len(tokens), BONDING_CURVE_CHANGE_MIN_STEP, BONDING_CURVE_CHANGE_MAX_STEP, seed=params.get('seed')
+            )
+        changing = np.flatnonzero(step % np.asarray(bonding_curve_change_intervals) == 0)
+    for i in changing:
+        tokens[i].change_bonding_curve()
 
-        if step % bonding_curve_param_change_interval == 0:  # More frequent parameter changes
+    if step % bonding_curve_param_change_interval == 0:  # More frequent parameter changes
+        for token in tokens:
             token.change_bonding_curve_parameters()
     return tokens
 
@@ -121,56 +284,57 @@ def token_simulation_step(step: int, tokens: List[Token], affiliates: List[Affil
     """
     Simulates a single step of the token economy.
 
+    Lists and pools trade with the same semantics and draws: every trade is quoted at
+    the start-of-step prices and supplies move once, after all trades are settled.
+
     Args:
         step (int): The current step in the simulation.
-        tokens (List[Token]): The list of tokens in the simulation.
+        tokens (List[Token]): The tokens in the simulation, either a list or a TokenPool.
         affiliates (List[Affiliate]): The list of affiliates in the simulation.
         params (Dict[str, Any]): Dictionary of simulation parameters.
     """
-    logging.debug(f"Starting token simulation step: {step}")
-    for affiliate in affiliates:
-        affiliate = _process_affiliate_trades(affiliate, tokens, step, params)
+    logger.debug("Starting token simulation step: %d", step)
+    _ensure_wallets(affiliates, len(tokens))
+    referral_amounts = _process_trades(affiliates, tokens, params)
+    _track_referrals(affiliates, referral_amounts)
 
     tokens = _update_tokens(tokens, step, params)
 
-    logging.debug(f"Finished token simulation step: {step}")
+    logger.debug("Finished token simulation step: %d", step)
 
 def affiliate_simulation_step(step: int, tokens: List[Token], affiliates: List[Affiliate], params: Dict[str, Any]) -> None:
     """
     Simulates a single step of the affiliate behavior.
 
+    Periodic sells of lists and pools alike are priced at each token's post-sell price.
+
     Args:
         step (int): The current step in the simulation.
-        tokens (List[Token]): The list of tokens in the simulation.
-        affiliates (List[Affiliate]): The list of affiliates in the simulation.
+        tokens (List[Token]): The tokens in the simulation, either a list or a TokenPool.
+        affiliates (List[Affiliate]): The affiliates in the simulation, either a list or an AffiliatePool.
         params (Dict[str, Any]): Dictionary of simulation parameters.
     """
-    logging.debug(f"Starting affiliate simulation step: {step}")
-    for affiliate in affiliates:
-        for token_name in list(affiliate.wallet.keys()):
-            if affiliate.wallet[token_name] > 0 and np.random.rand() < SELL_PROBABILITY:
-                tokens_to_sell_percentage = np.random.rand() * MAX_SELL_PERCENTAGE
-                tokens_to_sell = affiliate.wallet[token_name] * tokens_to_sell_percentage
-
-                for token in tokens:
-                    if token.name == token_name:
-                        token_price = token.sell(tokens_to_sell)
-                        sale_proceeds = token_price * tokens_to_sell
-                        affiliate.wallet[token_name] -= tokens_to_sell
-                        affiliate.base_currency_balance += sale_proceeds
-                        logging.debug(f"Affiliate {affiliate.affiliate_id} sold {tokens_to_sell:.2f} {token.name} for {sale_proceeds:.2f} (periodic sell)")
-                        affiliate.track_referral(sale_proceeds)  # Track commission on periodic sell
-                        break
-
-        affiliate.earnings_history.append(affiliate.total_earned)
-        affiliate.commission_rate_history.append(
-            affiliate.commission_rate
-        )
-        affiliate.adjust_commission_dynamically(step)
+    logger.debug("Starting affiliate simulation step: %d", step)
+    _ensure_wallets(affiliates, len(tokens))
+    referral_amounts = _process_sells(affiliates, tokens, params)
+    _track_referrals(affiliates, referral_amounts)
+
+    if isinstance(affiliates, AffiliatePool):
+        for affiliate, earned, rate in zip(affiliates, affiliates.total_earned.tolist(), affiliates.commission_rate.tolist()):
+            affiliate.earnings_history.append(earned)
+            affiliate.commission_rate_history.append(rate)
+        affiliates.adjust_commission_dynamically(step)  # One vectorized update for the whole pool
+    else:
+        for affiliate in affiliates:
+            affiliate.earnings_history.append(affiliate.total_earned)
+            affiliate.commission_rate_history.append(
+                affiliate.commission_rate
+            )
+            affiliate.adjust_commission_dynamically(step)
 
-    logging.debug(f"Finished affiliate simulation step: {step}")
+    logger.debug("Finished affiliate simulation step: %d", step)
 
-def run_simulation(params: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, List[Any]]], Dict[int, Dict[str, List[Any]]]]:
+def run_simulation(params: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, Any]], Dict[int, Dict[str, Any]]]:
     """
     Runs the entire simulation.
 
@@ -178,76 +342,90 @@ def run_simulation(params: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, List[Any
         params (Dict[str, Any]): A dictionary of simulation parameters.
 
     Returns:
-        Tuple[Dict[str, Dict[str, List[Any]]], Dict[int, Dict[str, List[Any]]]]: A tuple containing the token histories and affiliate histories.
+        Tuple[Dict[str, Dict[str, Any]], Dict[int, Dict[str, Any]]]: A tuple containing the token histories and affiliate histories.
+            Numeric histories are float32 arrays with one entry per step; "bonding_curve" holds uint8
+            indices into bonding_curve_functions, and an affiliate's "wallet" history has shape
+            (steps, tokens), with columns in token order.
     """
     initial_supply = params.get('initial_supply', 10000)
     initial_price = params.get('initial_price', 1.0)
     num_tokens = params.get('num_tokens', 5)
     num_affiliates = params.get('num_affiliates', 5)
     bonding_curve_functions_list = params.get('bonding_curve_functions', bonding_curve_functions)
-
-    tokens: List[Token] = [
-        Token(
-            f"Token_{i}",
-            initial_supply,
-            initial_price,
-            bonding_curve_functions_list[np.random.choice(len(bonding_curve_functions_list))],
+    params = dict(params)  # Leave the caller's dict untouched
+    seed = params.get('seed')
+    # Spawn independent child seeds; seeding every PCG64 consumer with the same seed would
+    # make them replay one stream, tying e.g. each token's curve to its change interval
+    rng_seed, interval_seed, reservoir_seed = np.random.SeedSequence(seed).spawn(3)
+    if seed is not None:  # Scalar draws come from the shared reservoir
+        default_reservoir.seed(reservoir_seed)
+    if 'rng' not in params:
+        params['rng'] = np.random.default_rng(rng_seed)  # One generator feeds every vectorized draw
+    rng: np.random.Generator = params['rng']
+    if 'bonding_curve_change_intervals' not in params:
+        params['bonding_curve_change_intervals'] = generate_bonding_curve_intervals(
+            num_tokens, BONDING_CURVE_CHANGE_MIN_STEP, BONDING_CURVE_CHANGE_MAX_STEP, seed=interval_seed
         )
-        for i in range(num_tokens)
-    ]
+
+    curve_choices = rng.integers(0, len(bonding_curve_functions_list), size=num_tokens)
+    tokens: TokenPool = TokenPool.create(
+        [f"Token_{i}" for i in range(num_tokens)],
+        initial_supply,
+        initial_price,
+        [bonding_curve_functions_list[choice] for choice in curve_choices],
+    )
 
     initial_commission_rate = params.get('initial_commission_rate', 0.10)
-    affiliates: List[Affiliate] = [Affiliate(i, initial_commission_rate, i < (num_affiliates // 5)) for i in range(num_affiliates)]
+    affiliates: AffiliatePool = AffiliatePool.create(num_affiliates, initial_commission_rate, num_affiliates // 5, num_tokens)
 
-    token_histories: Dict[str, Dict[str, List[Any]]] = {
-        token.name: {
-            "price": [],
-            "supply": [],
-            "bonding_curve": [],
-        }
-        for token in tokens
-    }
-    affiliate_histories: Dict[int, Dict[str, List[Any]]] = {
-        affiliate.affiliate_id: {
-            "earned": [],
-            "commission_rate": [],
-            "wallet": [],
-            "base_currency_balance": []
-        }
-        for affiliate in affiliates
-    }
+    num_simulation_steps = params.get('num_simulation_steps', 100)
+    # Histories are written by index into preallocated buffers and only wrapped into
+    # the per-token and per-affiliate dicts once the run is over.
+    price_history = np.empty((num_tokens, num_simulation_steps), dtype=np.float32)
+    supply_history = np.empty((num_tokens, num_simulation_steps), dtype=np.float32)
+    curve_history = np.empty((num_tokens, num_simulation_steps), dtype=np.uint8)
+    earned_history = np.empty((num_affiliates, num_simulation_steps), dtype=np.float32)
+    commission_rate_history = np.empty((num_affiliates, num_simulation_steps), dtype=np.float32)
+    balance_history = np.empty((num_affiliates, num_simulation_steps), dtype=np.float32)
+    wallet_history = np.zeros((num_affiliates, num_simulation_steps, num_tokens), dtype=np.float32)
+
+    params['bonding_curve_change_schedule'] = _build_change_schedule(
+        num_simulation_steps, params['bonding_curve_change_intervals']
+    )
 
     start_time = time.time()
-    logging.info("Simulation Started")
-    num_simulation_steps = params.get('num_simulation_steps', 100)
+    logger.info("Simulation Started")
     for step in range(num_simulation_steps):
         token_simulation_step(step, tokens, affiliates, params)
         affiliate_simulation_step(step, tokens, affiliates, params)
 
-        for token in tokens:
-            token_histories[token.name]["price"].append(token.price)
-            token_histories[token.name]["supply"].append(token.supply)
-            token_histories[token.name]["bonding_curve"].append(
-                token.bonding_curve_func.__name__
-            )
+        price_history[:, step] = tokens.current_prices()
+        supply_history[:, step] = tokens.supply
+        curve_history[:, step] = tokens.curve_id
 
-        for affiliate in affiliates:
-            affiliate_histories[affiliate.affiliate_id]["earned"].append(
-                affiliate.total_earned
-            )
-            affiliate_histories[affiliate.affiliate_id][
-                "commission_rate"
-            ].append(affiliate.commission_rate)
-            affiliate_histories[affiliate.affiliate_id]["wallet"].append(
-                {
-                    token_name: wallet_balance
-                    for token_name, wallet_balance in affiliate.wallet.items()
-                }
-            )
-            affiliate_histories[affiliate.affiliate_id]["base_currency_balance"].append(
-                affiliate.base_currency_balance
-            )
+        earned_history[:, step] = affiliates.total_earned
+        commission_rate_history[:, step] = affiliates.commission_rate
+        balance_history[:, step] = affiliates.base_currency_balance
+        wallet_history[:, step, :] = affiliates.wallet
+
+    token_histories: Dict[str, Dict[str, Any]] = {
+        token.name: {
+            "price": price_history[i],
+            "supply": supply_history[i],
+            "bonding_curve": curve_history[i],
+        }
+        for i, token in enumerate(tokens)
+    }
+    affiliate_histories: Dict[int, Dict[str, Any]] = {
+        affiliate.affiliate_id: {
+            "earned": earned_history[a],
+            "commission_rate": commission_rate_history[a],
+            "wallet": wallet_history[a],
+            "base_currency_balance": balance_history[a],
+        }
+        for a, affiliate in enumerate(affiliates)
+    }
 
     end_time = time.time()
-    logging.info(f"Simulation Completed in: {end_time - start_time:.2f} seconds")
+    logger.info("Simulation Completed in: %.2f seconds", end_time - start_time)
     return token_histories, affiliate_histories
\ No newline at end of file
@@ -21,8 +21,8 @@ Testing Framework:
 
 import unittest
 import numpy as np
-from affiliate import Affiliate
-from constants import INITIAL_COMMISSION_RATE, DYNAMIC_ADJUSTMENT_RATE
+from src.affiliate import Affiliate, AffiliatePool
+from src.constants import INITIAL_COMMISSION_RATE, DYNAMIC_ADJUSTMENT_RATE, MOVING_AVERAGE_WINDOW
 
 class TestAffiliate(unittest.TestCase):
     def setUp(self):
@@ -32,43 +32,57 @@ class TestAffiliate(unittest.TestCase):
         self.assertEqual(self.affiliate.affiliate_id, 1)
         self.assertEqual(self.affiliate.commission_rate, INITIAL_COMMISSION_RATE)
         self.assertEqual(self.affiliate.is_whale, False)
-        self.assertTrue(np.isclose(self.affiliate.base_currency_balance, np.array(1000.0, dtype=np.float32)))
-        self.assertEqual(self.affiliate.wallet, {})
-        self.assertTrue(np.isclose(self.affiliate.total_referral_amount, np.array(0.0, dtype=np.float32)))
-        self.assertTrue(np.isclose(self.affiliate.total_earned,  np.array(0.0, dtype=np.float32)))
+        self.assertAlmostEqual(self.affiliate.base_currency_balance, 1000.0)
+        self.assertEqual(self.affiliate.wallet.shape, (0,))
+        self.assertAlmostEqual(self.affiliate.total_referral_amount, 0.0)
+        self.assertAlmostEqual(self.affiliate.total_earned, 0.0)
         self.assertEqual(self.affiliate.earnings_history, [])
         self.assertEqual(self.affiliate.commission_rate_history, [])
         self.assertEqual(self.affiliate.recent_investment, [])
         self.assertEqual(self.affiliate.whale_investment_capacity, 0)
 
+    def test_wallet_indexed_by_token_id(self):
+        affiliate = Affiliate(0, INITIAL_COMMISSION_RATE, num_tokens=3)
+        np.testing.assert_array_equal(affiliate.wallet, np.zeros(3))
+        affiliate.wallet[2] += 5.0
+        self.assertEqual(affiliate.pool.wallet[0, 2], 5.0)  # The wallet is a view into the pool
+
     def test_calculate_commission(self):
         trade_amount = 100.0
         expected_commission = trade_amount * INITIAL_COMMISSION_RATE
         commission = self.affiliate.calculate_commission(trade_amount)
-        self.assertTrue(np.isclose(commission, expected_commission))
+        self.assertAlmostEqual(commission, expected_commission)
 
     def test_adjust_commission_dynamically_increase(self):
         self.affiliate.recent_investment = [60.0, 70.0, 80.0]
         self.affiliate.adjust_commission_dynamically(10)
-        self.assertTrue(np.isclose(self.affiliate.commission_rate, INITIAL_COMMISSION_RATE + DYNAMIC_ADJUSTMENT_RATE))
+        self.assertAlmostEqual(self.affiliate.commission_rate, INITIAL_COMMISSION_RATE + DYNAMIC_ADJUSTMENT_RATE)
         self.affiliate.commission_rate = 0.1999
         self.affiliate.adjust_commission_dynamically(10)
-        self.assertTrue(np.isclose(self.affiliate.commission_rate, 0.20))
+        self.assertAlmostEqual(self.affiliate.commission_rate, 0.20)
 
     def test_adjust_commission_dynamically_decrease(self):
         self.affiliate.recent_investment = [10.0, 20.0, 30.0]
         self.affiliate.adjust_commission_dynamically(10)
-        self.assertTrue(np.isclose(self.affiliate.commission_rate, INITIAL_COMMISSION_RATE - DYNAMIC_ADJUSTMENT_RATE))
+        self.assertAlmostEqual(self.affiliate.commission_rate, INITIAL_COMMISSION_RATE - DYNAMIC_ADJUSTMENT_RATE)
         self.affiliate.commission_rate = 0.0001
         self.affiliate.adjust_commission_dynamically(10)
-        self.assertTrue(np.isclose(self.affiliate.commission_rate, 0.0))
+        self.assertAlmostEqual(self.affiliate.commission_rate, 0.0)
 
     def test_track_referral(self):
         trade_amount = 50.0
         commission_earned = self.affiliate.calculate_commission(trade_amount)
         self.affiliate.track_referral(trade_amount)
-        self.assertTrue(np.isclose(self.affiliate.total_earned, np.array(commission_earned, dtype=np.float32)))
-        self.assertTrue(np.isclose(self.affiliate.total_referral_amount, np.array(trade_amount, dtype=np.float32)))
+        self.assertAlmostEqual(self.affiliate.total_earned, commission_earned)
+        self.assertAlmostEqual(self.affiliate.total_referral_amount, trade_amount)
+
+    def test_recent_investment_window(self):
+        for amount in range(MOVING_AVERAGE_WINDOW + 10):
+            self.affiliate.record_investment(float(amount))
+        expected = [float(a) for a in range(10, MOVING_AVERAGE_WINDOW + 10)]
+        self.assertEqual(self.affiliate.recent_investment, expected)
+        self.assertAlmostEqual(self.affiliate.pool.average_investment()[0], np.mean(expected))
+        self.assertAlmostEqual(self.affiliate.pool.average_investment(self.affiliate._index), np.mean(expected))
 
     def test_whale_initialization(self):
         whale = Affiliate(2, INITIAL_COMMISSION_RATE, is_whale=True)
@@ -77,5 +91,23 @@ class TestAffiliate(unittest.TestCase):
         self.assertGreater(whale.whale_investment_capacity, 5000)
         self.assertLess(whale.whale_investment_capacity, 10000)
 
+    def test_pool_affiliates_follow_slots(self):
+        pool = AffiliatePool(2)
+        Affiliate(1, 0.2, pool=pool)  # Created out of slot order
+        Affiliate(0, 0.1, pool=pool)
+        self.assertEqual([affiliate.affiliate_id for affiliate in pool], [0, 1])
+        self.assertEqual(pool[1].commission_rate, 0.2)
+        with self.assertRaises(ValueError):
+            Affiliate(0, 0.1, pool=pool)
+
+    def test_pool_commission_adjustment_logs_per_slot_at_debug(self):
+        pool = AffiliatePool.create(2, INITIAL_COMMISSION_RATE)
+        pool.record_investments(np.array([0, 1]), np.array([80.0, 10.0]))
+        with self.assertLogs("src.affiliate", level="DEBUG") as logs:
+            pool.adjust_commission_dynamically(10)
+        self.assertEqual(sum("Adjusted commission rates for 2 affiliates" in line for line in logs.output), 1)
+        self.assertTrue(any(line.startswith("DEBUG") and f"slot 0 commission rate adjusted from {INITIAL_COMMISSION_RATE:.4f} to {INITIAL_COMMISSION_RATE + DYNAMIC_ADJUSTMENT_RATE:.4f}" in line for line in logs.output))
+        self.assertTrue(any(line.startswith("DEBUG") and f"slot 1 commission rate adjusted from {INITIAL_COMMISSION_RATE:.4f} to {INITIAL_COMMISSION_RATE - DYNAMIC_ADJUSTMENT_RATE:.4f}" in line for line in logs.output))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -11,6 +11,7 @@ Test Coverage:
 - Sigmoid bonding curve: S-shaped price curve with upper bound
 - Root bonding curve: Square root relationship with supply
 - Inverse bonding curve: Decreasing price with increasing supply
+- Constant-product bonding curve: Price against a virtual x*y=k reserve
 - Edge cases: Zero supply, large values, boundary conditions
 
 Testing Approach:
@@ -22,12 +23,13 @@ Testing Approach:
 
 import unittest
 import numpy as np
-from bonding_curves import (
+from src.bonding_curves import (
     linear_bonding_curve,
     exponential_bonding_curve,
     sigmoid_bonding_curve,
     root_bonding_curve,
     inverse_bonding_curve,
+    constant_product_bonding_curve,
 )
 
 class TestBondingCurves(unittest.TestCase):
@@ -35,7 +37,7 @@ class TestBondingCurves(unittest.TestCase):
         supply = np.array([1000], dtype=np.float32)
         price = linear_bonding_curve(supply)
         self.assertTrue(isinstance(price, np.ndarray))
-        self.assertTrue(np.isclose(price, np.array([1.001], dtype=np.float32)))
+        self.assertTrue(np.isclose(price, np.array([2.0], dtype=np.float32)))  # 0.001 * 1000 + 1
 
         supply = np.array([0], dtype=np.float32)
         price = linear_bonding_curve(supply)
@@ -64,6 +66,21 @@ class TestBondingCurves(unittest.TestCase):
         self.assertTrue(isinstance(price, np.ndarray))
         self.assertTrue(np.isclose(price, np.array([10.0 / (1 + np.exp(5000 * 0.0001))], dtype=np.float32)))
 
+    def test_dtype_consistency(self):
+        for curve in (linear_bonding_curve, exponential_bonding_curve, sigmoid_bonding_curve, root_bonding_curve, inverse_bonding_curve, constant_product_bonding_curve):
+            self.assertIs(type(curve(1000.0)), float)
+            self.assertIs(type(curve(np.float32(1000.0))), float)
+            self.assertEqual(curve(np.array([1000.0], dtype=np.float64)).dtype, np.float32)
+
+    def test_sigmoid_bonding_curve_extreme_supply(self):
+        supply = np.array([0, 5000, 1e6], dtype=np.float32)
+        with np.errstate(over='raise'):
+            price = sigmoid_bonding_curve(supply, k=1.0)
+        self.assertTrue(np.all(np.isfinite(price)))
+        self.assertTrue(np.allclose(price, np.array([0.0, 5.0, 10.0], dtype=np.float32)))
+        self.assertEqual(sigmoid_bonding_curve(0.0, k=1.0), 0.0)
+        self.assertEqual(sigmoid_bonding_curve(1e6, k=1.0), 10.0)
+
     def test_root_bonding_curve(self):
         supply = np.array([10000], dtype=np.float32)
         price = root_bonding_curve(supply)
@@ -86,5 +103,17 @@ class TestBondingCurves(unittest.TestCase):
         self.assertTrue(isinstance(price, np.ndarray))
         self.assertTrue(np.isclose(price, np.array([100000.0], dtype=np.float32)))
 
+    def test_constant_product_bonding_curve(self):
+        supply = np.array([10000, 0], dtype=np.float32)
+        price = constant_product_bonding_curve(supply)
+        self.assertTrue(isinstance(price, np.ndarray))
+        self.assertTrue(np.allclose(price, np.array([1.0, 0.9801], dtype=np.float32)))
+        self.assertAlmostEqual(constant_product_bonding_curve(10000.0), 1.0)
+
+        with self.assertRaises(ValueError):
+            constant_product_bonding_curve(1e6)
+        with self.assertRaises(ValueError):
+            constant_product_bonding_curve(np.array([0, 2e6], dtype=np.float32))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -22,7 +22,7 @@ Testing Approach:
 import unittest
 import argparse
 from unittest.mock import patch
-from config import parse_arguments, get_config_from_args
+from src.config import parse_arguments, get_config_from_args, get_config
 
 class TestConfig(unittest.TestCase):
     @patch('argparse.ArgumentParser.parse_args')
@@ -43,7 +43,7 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(args.initial_price, 1.5)
         self.assertEqual(args.initial_commission_rate, 0.15)
 
-    @patch('config.parse_arguments')
+    @patch('src.config.parse_arguments')
     def test_get_config_from_args(self, mock_parse_arguments):
         mock_parse_arguments.return_value = argparse.Namespace(
             num_simulation_steps=200,
@@ -61,5 +61,15 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config["INITIAL_PRICE"], 1.5)
         self.assertEqual(config["INITIAL_COMMISSION_RATE"], 0.15)
 
+    @patch('argparse.ArgumentParser.parse_args')
+    def test_get_config(self, mock_parse_args):
+        config = get_config(num_tokens=8, initial_price=2.0)
+        mock_parse_args.assert_not_called()
+        self.assertEqual(config["NUM_TOKENS"], 8)
+        self.assertEqual(config["INITIAL_PRICE"], 2.0)
+        self.assertEqual(config["NUM_AFFILIATES"], 5)
+        with self.assertRaises(ValueError):
+            get_config(num_token=8)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -21,23 +21,28 @@ Testing Approach:
 - Integration testing with bonding curve functions
 """
 
+import functools
 import unittest
 import numpy as np
-from unittest.mock import MagicMock
-from crypto_token import Token
-from bonding_curves import linear_bonding_curve
+from src.crypto_token import Token, TokenPool
+from src.bonding_curves import linear_bonding_curve, exponential_bonding_curve, sigmoid_bonding_curve, root_bonding_curve, constant_product_bonding_curve
 
 class TestToken(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.initial_supply = 1000.0
+        cls.initial_price = linear_bonding_curve(cls.initial_supply)  # Start on the curve so buys raise and sells lower the price
+        cls._template = Token("TestToken", cls.initial_supply, cls.initial_price, linear_bonding_curve)
+
     def setUp(self):
-        self.initial_supply = 1000.0
-        self.initial_price = 1.0
-        self.bonding_curve_func = linear_bonding_curve
-        self.token = Token("TestToken", self.initial_supply, self.initial_price, self.bonding_curve_func)
+        template = self._template
+        self.bonding_curve_func = template.bonding_curve_func
+        self.token = Token(template.name, template.supply, template.price, template.bonding_curve_func)  # Each test gets its own copy
 
     def test_initialization(self):
         self.assertEqual(self.token.name, "TestToken")
-        self.assertTrue(np.isclose(self.token.supply, np.array(self.initial_supply, dtype=np.float32)))
-        self.assertTrue(np.isclose(self.token.price, np.array(self.initial_price, dtype=np.float32)))
+        self.assertAlmostEqual(self.token.supply, self.initial_supply)
+        self.assertAlmostEqual(self.token.price, self.initial_price)
         self.assertEqual(self.token.bonding_curve_func, self.bonding_curve_func)
         self.assertEqual(self.token.transaction_fee_rate, 0.0025)
         self.assertEqual(self.token.burn_rate, 0.0002)
@@ -47,17 +52,17 @@ class TestToken(unittest.TestCase):
         amount = 100.0
         old_price = self.token.price
         price = self.token.buy(amount)
-        self.assertTrue(np.isclose(self.token.supply, np.array(self.initial_supply + amount - (amount * self.token.transaction_fee_rate) - (amount * self.token.burn_rate), dtype=np.float32)))
+        self.assertAlmostEqual(self.token.supply, self.initial_supply + amount - (amount * self.token.transaction_fee_rate) - (amount * self.token.burn_rate))
         self.assertGreater(self.token.price, old_price)
-        self.assertTrue(np.isclose(price, self.token.price))
+        self.assertAlmostEqual(price, self.token.price)
 
     def test_sell(self):
         amount = 100.0
         old_price = self.token.price
         price = self.token.sell(amount)
-        self.assertTrue(np.isclose(self.token.supply, np.array(self.initial_supply - amount + (amount * self.token.transaction_fee_rate) + (amount * self.token.burn_rate), dtype=np.float32)))
+        self.assertAlmostEqual(self.token.supply, self.initial_supply - amount + (amount * self.token.transaction_fee_rate) + (amount * self.token.burn_rate))
         self.assertLess(self.token.price, old_price)
-        self.assertTrue(np.isclose(price, self.token.price))
+        self.assertAlmostEqual(price, self.token.price)
 
     def test_change_bonding_curve(self):
         initial_bonding_curve = self.token.bonding_curve_func
@@ -65,11 +70,123 @@ class TestToken(unittest.TestCase):
         self.assertNotEqual(self.token.bonding_curve_func, initial_bonding_curve)
         self.assertNotEqual(self.token.curve_metadata["function_name"], initial_bonding_curve.__name__)
 
+    def test_change_bonding_curve_after_parameter_change(self):
+        self.token.change_bonding_curve_parameters()
+        self.token.change_bonding_curve()
+        self.assertEqual(self.token.bonding_curve_func, exponential_bonding_curve)
+        self.assertEqual(self.token.curve_metadata["function_name"], "exponential_bonding_curve")
+
     def test_change_bonding_curve_parameters(self):
         initial_metadata = self.token.curve_metadata
         self.token.change_bonding_curve_parameters()
         self.assertNotEqual(self.token.curve_metadata, initial_metadata)
 
+    def test_price_follows_curve_changes(self):
+        self.token.calculate_price()  # Binds the current curve
+        self.token.change_bonding_curve_parameters()
+        self.assertEqual(self.token.calculate_price(), linear_bonding_curve(self.token.supply, *self.token.curve_params))
+        self.token.change_bonding_curve()
+        self.assertEqual(self.token.calculate_price(), exponential_bonding_curve(self.token.supply))
+
+    def test_standalone_token_matches_pool_token(self):
+        pool = TokenPool.create(["T"], self.initial_supply, self.initial_price, [linear_bonding_curve])
+        self.assertIsNone(self.token.pool)
+        for token in (self.token, pool[0]):
+            token.change_bonding_curve()
+            token.curve_params = (1.0, 0.001)
+            token.buy(100.0)
+            token.sell(40.0)
+        self.assertEqual(self.token.supply, pool[0].supply)
+        self.assertEqual(self.token.price, pool[0].price)
+        self.assertIs(type(self.token.supply), float)
+
+    def test_copy_is_detached(self):
+        self.token.buy(100.0)
+        self.token.change_bonding_curve()
+        self.assertAlmostEqual(self._template.supply, self.initial_supply)
+        self.assertEqual(self._template.bonding_curve_func, linear_bonding_curve)
+        self.assertEqual(self._template.curve_metadata, {"function_name": "linear_bonding_curve"})
+
+    def test_token_is_view_into_pool(self):
+        pool = TokenPool.create(["A", "B"], 1000.0, 1.0, [linear_bonding_curve, sigmoid_bonding_curve])
+        pool[1].buy(100.0)
+        self.assertAlmostEqual(pool.supply[1], 1000.0 + 100.0 * pool[1]._net_factor)
+        self.assertEqual(pool.supply[0], 1000.0)
+        self.assertEqual(pool.curve_id[1], 2)
+        self.assertEqual(pool[1].token_id, 1)
+
+    def test_pool_tokens_follow_slots(self):
+        pool = TokenPool(2)
+        Token("B", 1000.0, 1.0, root_bonding_curve, token_id=1, pool=pool)  # Created out of slot order
+        Token("A", 1000.0, 1.0, linear_bonding_curve, token_id=0, pool=pool)
+        self.assertEqual([token.name for token in pool], ["A", "B"])
+        pool.apply_supply_deltas(np.array([100.0, 100.0]))
+        np.testing.assert_allclose(pool.current_prices(), [linear_bonding_curve(pool.supply[0]), root_bonding_curve(pool.supply[1])])
+        with self.assertRaises(ValueError):
+            Token("C", 1000.0, 1.0, linear_bonding_curve, token_id=0, pool=pool)
+
+    def test_partly_filled_pool_is_rejected(self):
+        pool = TokenPool(2)
+        Token("A", 1000.0, 1.0, linear_bonding_curve, token_id=0, pool=pool)
+        with self.assertRaisesRegex(ValueError, "1 of 2 token slots"):
+            pool.apply_supply_deltas(np.array([100.0, 100.0]))
+        with self.assertRaisesRegex(ValueError, "1 of 2 token slots"):
+            pool.current_prices()
+        with self.assertRaisesRegex(ValueError, "1 of 2 token slots"):
+            list(pool)
+        Token("B", 1000.0, 1.0, linear_bonding_curve, token_id=1, pool=pool)
+        pool.apply_supply_deltas(np.array([100.0, 100.0]))
+        self.assertEqual(len(pool.current_prices()), 2)
+
+    def test_apply_supply_deltas_matches_buy_and_sell(self):
+        for func, count in ((linear_bonding_curve, 40), (sigmoid_bonding_curve, 10)):  # Batched, then per token
+            deltas = np.linspace(-50.0, 50.0, count)
+            deltas[count // 2] = 0.0
+            names = [f"T{i}" for i in range(count)]
+            pool = TokenPool.create(names, 5000.0, 1.0, [func] * count)
+            single = TokenPool.create(names, 5000.0, 1.0, [func] * count)
+            for a, b in zip(pool, single):
+                a.change_bonding_curve_parameters()
+                b.curve_params = a.curve_params
+
+            pool.apply_supply_deltas(deltas)
+            for token, delta in zip(single, deltas):
+                if delta > 0:
+                    token.buy(delta)
+                elif delta < 0:
+                    token.sell(-delta)
+
+            np.testing.assert_allclose(pool.supply, single.supply, rtol=1e-12)
+            np.testing.assert_allclose(pool.current_prices(), single.current_prices(), rtol=1e-9)
+
+    def test_current_prices_validates_every_group_size(self):
+        for count in (4, 40):  # Per-token curve calls, then one batched kernel call
+            pool = TokenPool.create([f"T{i}" for i in range(count)], 10000.0, 1.0, [constant_product_bonding_curve] * count)
+            pool.apply_supply_deltas(np.full(count, 2e6))  # Past the default virtual reserve
+            with self.assertRaises(ValueError):
+                pool.current_prices()
+
+    def test_unknown_curve_without_name(self):
+        with self.assertRaisesRegex(ValueError, "Unknown bonding curve function: functools.partial"):
+            Token("T", self.initial_supply, self.initial_price, functools.partial(linear_bonding_curve, m=2.0))
+
+    def test_apply_supply_deltas_oversell(self):
+        with self.assertRaises(ValueError):
+            TokenPool.create(["T"], self.initial_supply, self.initial_price, [linear_bonding_curve]).apply_supply_deltas(np.array([-2 * self.initial_supply]))
+
+    def test_trade_matches_buy_and_sell(self):
+        other = Token("Other", self.initial_supply, self.initial_price, self.bonding_curve_func)
+        self.token.trade(100.0)
+        other.buy(100.0)
+        self.assertEqual(self.token.supply, other.supply)
+        self.token.trade(-50.0)
+        other.sell(50.0)
+        self.assertEqual(self.token.supply, other.supply)
+        with self.assertRaises(ValueError):
+            self.token.trade(0.0)
+        with self.assertRaises(ValueError):
+            self.token.trade(-2 * self.initial_supply)
+
     def test_buy_with_fees_and_burn(self):
         amount = 100.0
         initial_supply = self.token.supply
@@ -80,7 +197,7 @@ class TestToken(unittest.TestCase):
 
         self.token.buy(amount)
 
-        self.assertTrue(np.isclose(self.token.supply, initial_supply + amount_after_fee))
+        self.assertAlmostEqual(self.token.supply, initial_supply + amount_after_fee)
         self.assertGreater(self.token.price, initial_price)
 
     def test_sell_with_fees_and_burn(self):
@@ -93,7 +210,7 @@ class TestToken(unittest.TestCase):
 
         self.token.sell(amount)
 
-        self.assertTrue(np.isclose(self.token.supply, initial_supply - amount_after_fee))
+        self.assertAlmostEqual(self.token.supply, initial_supply - amount_after_fee)
         self.assertLess(self.token.price, initial_price)
 
 if __name__ == '__main__':
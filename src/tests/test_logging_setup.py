@@ -0,0 +1,32 @@
+"""
+Unit tests for the logging configuration helper.
+
+This module contains unit tests for logging_setup.configure_logging, the single
+place where the application installs a logging handler.
+
+Test Coverage:
+- Root logger configuration with the default level
+- Custom log levels
+
+Testing Approach:
+- Mocked logging.basicConfig to verify arguments without touching global state
+"""
+
+import logging
+import unittest
+from unittest.mock import patch
+from src.logging_setup import configure_logging, LOG_FORMAT
+
+class TestLoggingSetup(unittest.TestCase):
+    @patch('logging.basicConfig')
+    def test_configure_logging_default(self, mock_basic_config):
+        configure_logging()
+        mock_basic_config.assert_called_once_with(level=logging.INFO, format=LOG_FORMAT)
+
+    @patch('logging.basicConfig')
+    def test_configure_logging_level(self, mock_basic_config):
+        configure_logging(logging.WARNING)
+        mock_basic_config.assert_called_once_with(level=logging.WARNING, format=LOG_FORMAT)
+
+if __name__ == '__main__':
+    unittest.main()
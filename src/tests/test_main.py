@@ -23,11 +23,27 @@ Testing Approach:
 import unittest
 from unittest.mock import patch
 import io
-import sys
-from main import main
+import re
+from contextlib import redirect_stdout
+import numpy as np
+from src.main import main
+
+# Summary lines in the order main() prints them; one DOTALL scan also checks section order
+_SUMMARY_RE = re.compile(
+    r"--- Token Summary ---.*"
+    r"Token: Token_0.*"
+    r"Final Price: 1\.20.*"
+    r"Final Supply: 1100\.00.*"
+    r"Final Bonding Curve: exponential_bonding_curve.*"
+    r"--- Affiliate Summary ---.*"
+    r"Affiliate: 0.*"
+    r"Final Base Currency: 800\.00.*"
+    r"Final Commission Rate: 0\.1100",
+    re.DOTALL,
+)
 
 class TestMain(unittest.TestCase):
-    @patch('main.run_simulation')
+    @patch('src.main.run_simulation')
     def test_main(self, mock_run_simulation):
         # Mock the return value of run_simulation
         mock_run_simulation.return_value = (
@@ -35,40 +51,26 @@ class TestMain(unittest.TestCase):
                 "Token_0": {
                     "price": [1.1, 1.2],
                     "supply": [1000.0, 1100.0],
-                    "bonding_curve": ["linear_bonding_curve", "exponential_bonding_curve"],
+                    "bonding_curve": np.array([0, 1], dtype=np.uint8),  # linear, then exponential
                 }
             },
             {
                 0: {
                     "earned": [10.0, 11.0],
                     "commission_rate": [0.1, 0.11],
-                    "wallet": [{"Token_0": 100.0}, {"Token_0": 110.0}],
+                    "wallet": np.array([[100.0], [110.0]]),
                     "base_currency_balance": [900.0, 800.0],
                 }
             },
         )
 
-        # Capture the printed output
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-
-        # Call the main function
-        main()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
+        # Capture the printed output; redirect_stdout restores sys.stdout even if main() raises
+        with redirect_stdout(io.StringIO()) as buf:
+            main()
+        output = buf.getvalue()
 
         # Assert that the summary is printed
-        output = captured_output.getvalue()
-        self.assertIn("--- Token Summary ---", output)
-        self.assertIn("Token: Token_0", output)
-        self.assertIn("Final Price: 1.20", output)
-        self.assertIn("Final Supply: 1100.00", output)
-        self.assertIn("Final Bonding Curve: exponential_bonding_curve", output)
-        self.assertIn("--- Affiliate Summary ---", output)
-        self.assertIn("Affiliate: 0", output)
-        self.assertIn("Final Base Currency: 800.00", output)
-        self.assertIn("Final Commission Rate: 0.1100", output)
+        self.assertRegex(output, _SUMMARY_RE)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+Unit tests for the RandomReservoir class.
+
+This module contains unit tests for the batched random number reservoir used
+for scalar parameter draws, covering range handling, refills and reproducibility.
+
+Test Coverage:
+- Uniform draws stay within the requested range
+- Reservoir refills once a block is exhausted
+- Seeded generators produce reproducible draws
+- Input validation for the block size
+
+Testing Approach:
+- Uses Python's built-in unittest framework
+- Small block sizes to exercise the refill path
+"""
+
+import unittest
+import numpy as np
+from src.random_reservoir import RandomReservoir
+
+class TestRandomReservoir(unittest.TestCase):
+    def test_uniform_range(self):
+        reservoir = RandomReservoir(size=16)
+        for _ in range(100):
+            value = reservoir.uniform(5000, 10000)
+            self.assertGreaterEqual(value, 5000)
+            self.assertLess(value, 10000)
+
+    def test_refill(self):
+        reservoir = RandomReservoir(size=4)
+        draws = [reservoir.uniform(0.0, 1.0) for _ in range(10)]
+        self.assertEqual(len(draws), 10)
+        self.assertEqual(len(set(draws)), 10)
+
+    def test_seeded_reproducibility(self):
+        first = RandomReservoir(size=8, rng=np.random.default_rng(42))
+        second = RandomReservoir(size=8, rng=np.random.default_rng(42))
+        self.assertEqual([first.uniform(0, 1) for _ in range(20)], [second.uniform(0, 1) for _ in range(20)])
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            RandomReservoir(size=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,14 +22,93 @@ Testing Approach:
 """
 
 import unittest
-from unittest.mock import patch, MagicMock
-from simulation import run_simulation, token_simulation_step, affiliate_simulation_step
-from config import NUM_SIMULATION_STEPS, NUM_TOKENS, NUM_AFFILIATES, INITIAL_SUPPLY, INITIAL_PRICE, INITIAL_COMMISSION_RATE
+from unittest.mock import patch
+from src.simulation import run_simulation, token_simulation_step, affiliate_simulation_step, _settle_trades, _build_change_schedule, _update_tokens
+from src.crypto_token import Token, TokenPool
+from src.affiliate import Affiliate, AffiliatePool
+from src.bonding_curves import linear_bonding_curve, bonding_curve_functions
+from src.constants import generate_bonding_curve_intervals, BONDING_CURVE_CHANGE_MIN_STEP, BONDING_CURVE_CHANGE_MAX_STEP, BUY_PROBABILITY, MAX_SELL_PERCENTAGE
+from src.config import NUM_SIMULATION_STEPS, NUM_TOKENS, NUM_AFFILIATES, INITIAL_SUPPLY, INITIAL_PRICE, INITIAL_COMMISSION_RATE
 import numpy as np
 
+class FakeToken:
+    """Minimal stand-in for Token with fixed price and no-op curve updates."""
+    __slots__ = ("name", "token_id", "price", "supply")
+
+    def __init__(self, name, token_id):
+        self.name = name
+        self.token_id = token_id
+        self.price = 1.0
+        self.supply = 1000.0
+
+    def buy(self, amount):
+        self.supply += amount
+        return self.price
+
+    def sell(self, amount):
+        self.supply -= amount
+        return self.price
+
+    def trade(self, amount):
+        self.supply += amount
+        return self.price
+
+    def change_bonding_curve(self):
+        pass
+
+    def change_bonding_curve_parameters(self):
+        pass
+
+class FakeAffiliate:
+    """Minimal stand-in for Affiliate that records calls in plain attributes."""
+    __slots__ = (
+        "affiliate_id", "is_whale", "whale_investment_capacity", "base_currency_balance", "wallet",
+        "total_earned", "commission_rate", "earnings_history", "commission_rate_history", "investments",
+    )
+
+    def __init__(self, affiliate_id, wallet):
+        self.affiliate_id = affiliate_id
+        self.is_whale = False
+        self.whale_investment_capacity = 0.0
+        self.base_currency_balance = 1000.0
+        self.wallet = wallet
+        self.total_earned = 0.0
+        self.commission_rate = 0.10
+        self.earnings_history = []
+        self.commission_rate_history = []
+        self.investments = []
+
+    def record_investment(self, amount):
+        self.investments.append(amount)
+
+    def track_referral(self, amount):
+        self.total_earned += amount * self.commission_rate
+
+    def adjust_commission_dynamically(self, step):
+        pass
+
+class FakeRng:
+    """Minimal stand-in for np.random.Generator that replays queued draws, one queue per method."""
+    __slots__ = ("draws",)
+
+    def __init__(self, **draws):
+        self.draws = {method: list(queue) for method, queue in draws.items()}
+
+    def _next(self, method, shape):
+        return np.broadcast_to(np.asarray(self.draws[method].pop(0)), shape).copy()
+
+    def integers(self, low, high=None, size=None):
+        return self._next("integers", np.shape(low) if size is None else size).astype(np.int64)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return self._next("uniform", size)
+
+    def random(self, size=None):
+        return self._next("random", size)
+
 class TestSimulation(unittest.TestCase):
-    @patch('simulation.token_simulation_step')
-    @patch('simulation.affiliate_simulation_step')
+    @patch('src.simulation.token_simulation_step')
+    @patch('src.simulation.affiliate_simulation_step')
     def test_run_simulation(self, mock_affiliate_simulation_step, mock_token_simulation_step):
         params = {
             'num_simulation_steps': 2,
@@ -47,75 +126,192 @@ class TestSimulation(unittest.TestCase):
         mock_token_simulation_step.assert_called()
         mock_affiliate_simulation_step.assert_called()
 
-        for token_name, histories in token_histories.items():
-            self.assertIn("price", histories)
-            self.assertIn("supply", histories)
-            self.assertIn("bonding_curve", histories)
-            self.assertEqual(len(histories["price"]), params['num_simulation_steps'])
-            self.assertEqual(len(histories["supply"]), params['num_simulation_steps'])
-            self.assertEqual(len(histories["bonding_curve"]), params['num_simulation_steps'])
-
-        for aff_id, histories in affiliate_histories.items():
-            self.assertIn("earned", histories)
-            self.assertIn("commission_rate", histories)
-            self.assertIn("wallet", histories)
-            self.assertIn("base_currency_balance", histories)
-            self.assertEqual(len(histories["earned"]), params['num_simulation_steps'])
-            self.assertEqual(len(histories["commission_rate"]), params['num_simulation_steps'])
-            self.assertEqual(len(histories["wallet"]), params['num_simulation_steps'])
-            self.assertEqual(len(histories["base_currency_balance"]), params['num_simulation_steps'])
+        steps = params['num_simulation_steps']
+        for key in ("price", "supply", "bonding_curve"):
+            stacked = np.array([histories[key] for histories in token_histories.values()])
+            self.assertEqual(stacked.shape, (params['num_tokens'], steps))
+        for key in ("earned", "commission_rate", "base_currency_balance"):
+            stacked = np.array([histories[key] for histories in affiliate_histories.values()])
+            self.assertEqual(stacked.shape, (params['num_affiliates'], steps))
+        wallets = np.array([histories["wallet"] for histories in affiliate_histories.values()])
+        self.assertEqual(wallets.shape, (params['num_affiliates'], steps, params['num_tokens']))
+
+    def test_run_simulation_token_count_override(self):
+        params = {
+            'num_simulation_steps': 3,
+            'num_tokens': NUM_TOKENS + 3,
+            'num_affiliates': 2,
+            'seed': 7,
+        }
+        token_histories, _ = run_simulation(params)
+        self.assertEqual(len(token_histories), NUM_TOKENS + 3)
+        self.assertNotIn('bonding_curve_change_intervals', params)
+
+    def test_run_simulation_seed_is_reproducible(self):
+        params = {'num_simulation_steps': 30, 'num_tokens': 3, 'num_affiliates': 10, 'seed': 11}
+        first, _ = run_simulation(params)
+        second, _ = run_simulation(params)
+        for token_name in first:
+            np.testing.assert_array_equal(first[token_name]["price"], second[token_name]["price"])
+
+    def test_run_simulation_seed_streams_are_independent(self):
+        captured = []
+        def capture(*args, **kwargs):
+            captured.append(generate_bonding_curve_intervals(*args, **kwargs))
+            return captured[-1]
+
+        pairs = set()
+        with patch('src.simulation.generate_bonding_curve_intervals', side_effect=capture):
+            for seed in range(40):
+                token_histories, _ = run_simulation({'num_simulation_steps': 1, 'num_tokens': 5, 'num_affiliates': 1, 'seed': seed})
+                curves = [int(histories["bonding_curve"][0]) for histories in token_histories.values()]
+                span = BONDING_CURVE_CHANGE_MAX_STEP - BONDING_CURVE_CHANGE_MIN_STEP
+                buckets = (captured[-1] - BONDING_CURVE_CHANGE_MIN_STEP) * len(bonding_curve_functions) // span
+                pairs.update(zip(buckets.tolist(), curves))
+        self.assertGreater(len(pairs), 24)  # A shared stream pins each interval bucket to one or two curves
 
     def test_token_simulation_step(self):
-        # Create mock objects for tokens and affiliates
-        mock_token1 = MagicMock()
-        mock_token1.name = "Token1"
-        mock_token2 = MagicMock()
-        mock_token2.name = "Token2"
-        tokens = [mock_token1, mock_token2]
-
-        mock_affiliate1 = MagicMock()
-        mock_affiliate1.affiliate_id = 1
-        mock_affiliate2 = MagicMock()
-        mock_affiliate2.affiliate_id = 2
-        affiliates = [mock_affiliate1, mock_affiliate2]
-
-        params = {}
-
-        # Call the function
+        tokens = [FakeToken("Token1", 0), FakeToken("Token2", 1)]
+        affiliates = [FakeAffiliate(1, np.zeros(2)), FakeAffiliate(2, np.zeros(2))]
+
+        # Slot 0: affiliate 1 buys 15 of Token1 and affiliate 2 buys 10 of Token2;
+        # slot 1: affiliate 1 sells 10 of its Token1 back. Every price is the stub's 1.0.
+        params = {'rng': FakeRng(
+            integers=[[2, 1], [0, 1], [0]],
+            uniform=[0.0, 0.0],
+            random=[[1.0, 0.0], [0.0, 0.0], [0.0], [BUY_PROBABILITY]],
+        )}
+
         token_simulation_step(1, tokens, affiliates, params)
 
-        # Assert that the _process_affiliate_trades function was called for each affiliate
-        for affiliate in affiliates:
-            self.assertTrue(hasattr(affiliate, "_process_affiliate_trades"))
+        trader, buyer = affiliates
+        np.testing.assert_allclose(trader.wallet, [5.0, 0.0])
+        np.testing.assert_allclose(buyer.wallet, [0.0, 10.0])
+        self.assertAlmostEqual(trader.base_currency_balance, 995.0)
+        self.assertAlmostEqual(buyer.base_currency_balance, 990.0)
+        np.testing.assert_allclose([token.supply for token in tokens], [1005.0, 1010.0])
+        self.assertAlmostEqual(trader.total_earned, 25.0 * trader.commission_rate)  # Commission on both legs
+        self.assertAlmostEqual(buyer.total_earned, 10.0 * buyer.commission_rate)
+        self.assertEqual(trader.investments, [15.0, 10.0])
+        self.assertEqual(buyer.investments, [10.0])
+
+    def test_token_simulation_step_with_pool(self):
+        tokens = [Token(f"Token{i}", 10000, 1.0, linear_bonding_curve, token_id=i) for i in range(3)]
+        pool = AffiliatePool.create(20, 0.10, 4, num_tokens=3)
+        params = {'rng': np.random.default_rng(3)}
+
+        token_simulation_step(1, tokens, pool, params)
+
+        self.assertTrue(np.all(pool.base_currency_balance >= 0))
+        self.assertTrue(np.all(pool.wallet >= 0))
+        held = pool.wallet.sum()
+        supply_change = sum(token.supply - 10000 for token in tokens)
+        self.assertAlmostEqual(supply_change, held * tokens[0]._net_factor, places=6)
+        self.assertGreater(pool.total_referral_amount.sum(), 0)
+
+    def test_affiliate_simulation_step_with_pool(self):
+        tokens = [Token(f"Token{i}", 10000, 1.0, linear_bonding_curve, token_id=i) for i in range(3)]
+        pool = AffiliatePool.create(20, 0.10, 4, num_tokens=3)
+        pool.wallet[:] = 100.0
+        params = {'rng': np.random.default_rng(5)}
+
+        affiliate_simulation_step(1, tokens, pool, params)
+
+        sold = 100.0 * pool.wallet.size - pool.wallet.sum()
+        self.assertGreater(sold, 0)
+        self.assertTrue(np.all(pool.wallet > 0))  # Never more than MAX_SELL_PERCENTAGE of a holding
+        supply_change = sum(token.supply - 10000 for token in tokens)
+        self.assertAlmostEqual(supply_change, -sold * tokens[0]._net_factor, places=6)
+        self.assertGreater(pool.base_currency_balance.sum(), 20 * 1000.0)
+        self.assertEqual(len(pool[0].earnings_history), 1)
+
+    def test_list_path_wallets_follow_token_positions(self):
+        tokens = [Token(f"T{i}", 10000, 1.0, linear_bonding_curve) for i in range(3)]  # All default to token_id 0
+        affiliates = [Affiliate(i, 0.10) for i in range(5)]  # Private pools with empty wallets
+        params = {'rng': np.random.default_rng(2)}
+
+        for step in range(1, 6):
+            token_simulation_step(step, tokens, affiliates, params)
+            affiliate_simulation_step(step, tokens, affiliates, params)
 
-        # Assert that the _update_tokens function was called
-        self.assertTrue(hasattr(tokens[0], "change_bonding_curve"))
+        wallets = np.array([affiliate.wallet for affiliate in affiliates])
+        self.assertEqual(wallets.shape, (5, 3))
+        for j, token in enumerate(tokens):
+            self.assertAlmostEqual(token.supply - 10000, wallets[:, j].sum() * token._net_factor, places=6)
+
+    def test_list_path_matches_pool_path(self):
+        num_steps = 6
+        pools = [AffiliatePool.create(12, 0.10, 3, num_tokens=3) for _ in range(2)]
+        pools[1].whale_capacity[:] = pools[0].whale_capacity
+        pools[1].is_whale[:] = pools[0].is_whale
+        token_pools = [TokenPool.create([f"T{i}" for i in range(3)], 10000.0, 1.0, [linear_bonding_curve] * 3) for _ in range(2)]
+        containers = [(token_pools[0], pools[0]), (list(token_pools[1]), list(pools[1]))]
+        for tokens, affiliates in containers:
+            params = {
+                'rng': np.random.default_rng(11),
+                'bonding_curve_change_schedule': np.zeros((num_steps + 1, 3), dtype=bool),
+                'bonding_curve_param_change_interval': num_steps + 1,  # Keep curves fixed so only trades move prices
+            }
+            for step in range(1, num_steps + 1):
+                token_simulation_step(step, tokens, affiliates, params)
+                affiliate_simulation_step(step, tokens, affiliates, params)
+
+        np.testing.assert_allclose(pools[1].base_currency_balance, pools[0].base_currency_balance)
+        np.testing.assert_allclose(pools[1].wallet, pools[0].wallet)
+        np.testing.assert_allclose(pools[1].total_earned, pools[0].total_earned)
+        np.testing.assert_allclose(token_pools[1].supply, token_pools[0].supply)
+        self.assertGreater(pools[0].wallet.sum(), 0)
+
+    def test_settle_trades(self):
+        balance = np.array([100.0, 5.0, 0.0, 0.0])
+        held = np.array([0.0, 0.0, 3.0, 10.0])
+        price = np.array([2.0, 2.0, 2.0, 2.0])
+        invest = np.array([10.0, 10.0, 10.0, 10.0])
+        is_buy = np.array([True, True, False, False])
+
+        balance_delta, net, turnover = _settle_trades(balance, held, price, invest, is_buy)
+
+        np.testing.assert_allclose(balance_delta, [-10.0, 0.0, 6.0, 10.0])  # Unaffordable buy skipped, sells capped at holdings
+        np.testing.assert_allclose(net, [5.0, 0.0, -3.0, -5.0])
+        np.testing.assert_allclose(turnover, [10.0, 0.0, 6.0, 10.0])
+
+    def test_update_tokens_draws_intervals_once(self):
+        tokens = [FakeToken(f"Token{i}", i) for i in range(4)]
+        params = {'seed': 5}
+
+        _update_tokens(tokens, 1, params)
+        intervals = params['bonding_curve_change_intervals']
+        _update_tokens(tokens, 2, params)
+
+        self.assertIs(params['bonding_curve_change_intervals'], intervals)  # Later steps reuse the first draw
+        np.testing.assert_array_equal(intervals, generate_bonding_curve_intervals(4, BONDING_CURVE_CHANGE_MIN_STEP, BONDING_CURVE_CHANGE_MAX_STEP, seed=5))
+        self.assertTrue(np.all((intervals >= BONDING_CURVE_CHANGE_MIN_STEP) & (intervals < BONDING_CURVE_CHANGE_MAX_STEP)))
+
+    def test_build_change_schedule(self):
+        schedule = _build_change_schedule(7, [2, 3])
+        expected = np.array([[step % 2 == 0, step % 3 == 0] for step in range(7)])
+        np.testing.assert_array_equal(schedule, expected)
 
     def test_affiliate_simulation_step(self):
-        # Create mock objects for tokens and affiliates
-        mock_token1 = MagicMock()
-        mock_token1.name = "Token1"
-        mock_token2 = MagicMock()
-        mock_token2.name = "Token2"
-        tokens = [mock_token1, mock_token2]
-
-        mock_affiliate1 = MagicMock()
-        mock_affiliate1.affiliate_id = 1
-        mock_affiliate1.wallet = {"Token1": 100, "Token2": 50}
-        mock_affiliate2 = MagicMock()
-        mock_affiliate2.affiliate_id = 2
-        affiliates = [mock_affiliate1, mock_affiliate2]
-
-        params = {}
-
-        # Call the function
+        tokens = [FakeToken("Token1", 0), FakeToken("Token2", 1)]
+        affiliates = [FakeAffiliate(1, np.array([100.0, 50.0])), FakeAffiliate(2, np.zeros(2))]
+
+        # Only the first holding is drawn for a sell, by the full MAX_SELL_PERCENTAGE
+        params = {'rng': FakeRng(random=[[[0.0, 1.0], [0.0, 0.0]], 1.0])}
+
         affiliate_simulation_step(1, tokens, affiliates, params)
 
-        # Assert that the affiliate methods were called
+        seller, idle = affiliates
+        sold = 100.0 * MAX_SELL_PERCENTAGE
+        np.testing.assert_allclose(seller.wallet, [100.0 - sold, 50.0])
+        np.testing.assert_allclose([token.supply for token in tokens], [1000.0 - sold, 1000.0])
+        self.assertAlmostEqual(seller.base_currency_balance, 1000.0 + sold)
+        self.assertAlmostEqual(seller.total_earned, sold * seller.commission_rate)
+        np.testing.assert_array_equal(idle.wallet, np.zeros(2))  # An empty wallet has nothing to sell
+        self.assertEqual(idle.base_currency_balance, 1000.0)
         for affiliate in affiliates:
-            self.assertTrue(hasattr(affiliate, "adjust_commission_dynamically"))
-            self.assertTrue(hasattr(affiliate, "earnings_history"))
-            self.assertTrue(hasattr(affiliate, "commission_rate_history"))
+            self.assertEqual(affiliate.earnings_history, [affiliate.total_earned])
+            self.assertEqual(affiliate.commission_rate_history, [0.10])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file